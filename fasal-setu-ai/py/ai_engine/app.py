@@ -1,3 +1,4 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from typing import Any, Dict, List
 
@@ -6,15 +7,21 @@ try:  # package-relative imports
     from .schemas.act_response import ActResponse  # type: ignore
     from .graph.state import PlannerState, Message  # type: ignore
     from .graph.router import router_node  # type: ignore
-    from .graph.tools_node import tools_node  # type: ignore
+    from .graph.tools_node import tools_node, warmup  # type: ignore
 except Exception:  # fallback for script execution inside folder
     from schemas.act_request import ActRequest  # type: ignore
     from schemas.act_response import ActResponse  # type: ignore
     from graph.state import PlannerState, Message  # type: ignore
     from graph.router import router_node  # type: ignore
-    from graph.tools_node import tools_node  # type: ignore
+    from graph.tools_node import tools_node, warmup  # type: ignore
 
-app = FastAPI(title="AI Engine (LLM-1 + Tools)")
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    # Kick off tool cold-start loads in the background; requests don't wait on them
+    warmup()
+    yield
+
+app = FastAPI(title="AI Engine (LLM-1 + Tools)", lifespan=lifespan)
 
 @app.get("/ping")
 def ping():
@@ -55,8 +62,9 @@ def act_endpoint(request: ActRequest):
     state = PlannerState(query=norm_q, profile=profile)
     state = router_node(state)
     state = tools_node(state)
-    # Build response
-    response = ActResponse(
+    # Build response. Every field comes from the already-validated PlannerState, so
+    # skip a second validation pass (FastAPI still checks the response_model on return).
+    response = ActResponse.model_construct(
         intent=state.intent or "unknown_intent",
         decision_template=state.decision_template or "unknown_template",
         missing=state.missing,
@@ -1,6 +1,6 @@
 from typing import Any, Dict, List, Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, SkipValidation
 
 class Message(BaseModel):
     role: Literal["system", "user", "assistant"]
@@ -52,6 +52,6 @@ class PlannerState(BaseModel):
         decision_template: Optional[str] = None
         pending_tool_calls: List[ToolCall] = Field(default_factory=list)
         tool_calls: List[ToolCall] = Field(default_factory=list)
-        facts: Dict[str, Any] = Field(default_factory=dict)
+        facts: SkipValidation[Dict[str, Any]] = Field(default_factory=dict)
         missing: Optional[List[str]] = None
         general_answer: Optional[str] = None
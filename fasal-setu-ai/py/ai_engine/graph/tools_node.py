@@ -4,7 +4,16 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, List, Optional, Tuple, cast
+import sys
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import requests  # only used to classify transport errors raised by tools
+except Exception:
+    requests = None
 
 from .state import PlannerState, ToolCall
 
@@ -30,6 +39,26 @@ FACT_SLOT: Dict[str, str] = {
 
 # Location dependent tool names used repeatedly
 LOCATION_BASED_TOOLS: List[str] = ["weather_outlook", "soil_api", "storage_find"]
+LOCATION_BASED_TOOLS_SET = frozenset(LOCATION_BASED_TOOLS)
+
+# (state, district) -> geocode result (None when unresolvable), collected once per tools_node pass
+Regions = Dict[Tuple[str, str], Optional[Dict[str, Any]]]
+
+# Per-process circuit breaker: tool name -> (consecutive failures, reopen_at monotonic time).
+# After _BREAKER_THRESHOLD consecutive failures a tool is short-circuited for _BREAKER_COOLDOWN_S.
+_BREAKERS: Dict[str, Tuple[int, float]] = {}
+_BREAKER_THRESHOLD = 5
+_BREAKER_COOLDOWN_S = 30.0
+
+# Transient upstream/network failures: reported as {"kind": "transient"} and counted by the breaker.
+RETRYABLE: Tuple[type, ...] = (TimeoutError, ConnectionError, OSError) + (
+    (requests.exceptions.RequestException,) if requests is not None else ()
+)
+# Failures caused by the planner's arguments (incl. nulls / wrong types): reported as
+# {"kind": "bad_args"}, never trip the breaker.
+# Anything else is reported per call as {"kind": "internal"} (logged with traceback) so the
+# rest of the batch still runs.
+BAD_ARGS: Tuple[type, ...] = (ValueError, KeyError, TypeError)
 
 ############################
 # Tool import registration #
@@ -149,13 +178,64 @@ except Exception:  # noqa: E722
 TOOL_MAP["geocode_tool"] = geocode_run
 
 
+def warmup(wait: bool = False) -> List["Future[Any]"]:
+    """Run each registered tool module's ``warmup()`` (cold-start loads) on a thread pool.
+
+    Independent I/O (geo snapshot, Pinecone index handshake, ...) overlaps instead of
+    landing on the first request. Pass ``wait=True`` to block until all have finished.
+    """
+    hooks = []
+    for mod_name in dict.fromkeys(fn.__module__ for fn in TOOL_MAP.values()):
+        if mod_name == __name__:  # in-file stubs; skip our own warmup
+            continue
+        hook = getattr(sys.modules.get(mod_name), "warmup", None)
+        if callable(hook):
+            hooks.append(hook)
+    if not hooks:
+        return []
+    pool = ThreadPoolExecutor(max_workers=len(hooks), thread_name_prefix="tool-warmup")
+    futures = [pool.submit(h) for h in hooks]
+    pool.shutdown(wait=wait)
+    return futures
+
+
+@lru_cache(maxsize=256)
+def _geocode_cached(state: str, district: str) -> Optional[Dict[str, Any]]:
+    """Geocode a (state, district) pair once per process; None when it cannot be resolved."""
+    try:
+        geo = geocode_run({"state": state, "district": district})
+    except Exception as ge:
+        logger.debug("Geocode failed for (%s, %s): %s", state, district, ge)
+        return None
+    data = (geo or {}).get("data") or {}
+    return geo if "lat" in data and "lon" in data else None
+
+
+def _collect_regions(calls: List[ToolCall], profile: Optional[Dict[str, Any]]) -> Regions:
+    """Geocode each distinct (state, district) needed by location-based calls exactly once."""
+    prof = profile or {}
+    regions: Regions = {}
+    for call in calls:
+        if call.tool not in LOCATION_BASED_TOOLS_SET:
+            continue
+        if call.args.get("lat") is not None and call.args.get("lon") is not None:
+            continue
+        state = call.args.get("state") or prof.get("state")
+        district = call.args.get("district") or prof.get("district")
+        if isinstance(state, str) and isinstance(district, str) and (state, district) not in regions:
+            regions[(state, district)] = _geocode_cached(state, district)
+    return regions
+
+
 def _maybe_enrich_latlon(
     args: Dict[str, Any],
     profile: Optional[Dict[str, Any]],
+    regions: Optional[Regions] = None,
 ) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
     """Best-effort lat/lon enrichment.
 
-    If args lacks lat/lon but state+district exist (directly or in profile), call geocoder.
+    If args lacks lat/lon but state+district exist (directly or in profile), use the
+    pre-collected `regions` lookup, falling back to the (cached) geocoder.
     Returns (args, meta) where meta may include {"geocode": {...}}.
     """
     args = dict(args)
@@ -175,15 +255,15 @@ def _maybe_enrich_latlon(
     # Try state+district → geocode
     state = args.get("state") or prof.get("state")
     district = args.get("district") or prof.get("district")
-    if state and district:
-        try:
-            geo = geocode_run({"state": state, "district": district})
-            data = (geo or {}).get("data") or {}
-            if "lat" in data and "lon" in data:
-                args["lat"], args["lon"] = float(data["lat"]), float(data["lon"])
+    if isinstance(state, str) and isinstance(district, str) and state and district:
+        key = (state, district)
+        geo = regions[key] if regions is not None and key in regions else _geocode_cached(state, district)
+        if geo:
+            try:
+                args["lat"], args["lon"] = float(geo["data"]["lat"]), float(geo["data"]["lon"])
                 return args, {"geocode": geo}
-        except Exception as ge:
-            logger.debug("Geocode failed for (%s, %s): %s", state, district, ge)
+            except (KeyError, TypeError, ValueError) as ge:
+                logger.debug("Geocode result unusable for (%s, %s): %s", state, district, ge)
 
     return args, None
 
@@ -193,6 +273,7 @@ def _normalize_args(
     args: Dict[str, Any],
     profile: Optional[Dict[str, Any]],
     temp_facts: Optional[Dict[str, Any]] = None,
+    regions: Optional[Regions] = None,
 ) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
     """Per-tool normalization (defaults, lat/lon inference, etc.)."""
     args = dict(args)
@@ -217,7 +298,7 @@ def _normalize_args(
                 return args, {"geocode": facts["location"]}
                 
         # Fallback to the regular lookup
-        args, meta = _maybe_enrich_latlon(args, profile)
+        args, meta = _maybe_enrich_latlon(args, profile, regions)
 
     elif tool == "soil_api":
         # Similar check for geocode results
@@ -228,7 +309,7 @@ def _normalize_args(
                 args["lon"] = float(location_data["lon"])
                 return args, {"geocode": facts["location"]}
                 
-        args, meta = _maybe_enrich_latlon(args, profile)
+        args, meta = _maybe_enrich_latlon(args, profile, regions)
 
     elif tool == "storage_find":
         args.setdefault("state", (profile or {}).get("state"))
@@ -242,7 +323,7 @@ def _normalize_args(
                 args["lon"] = float(location_data["lon"])
                 meta = {"geocode": facts["location"]}
         else:
-            args, meta = _maybe_enrich_latlon(args, profile)
+            args, meta = _maybe_enrich_latlon(args, profile, regions)
             
         args.setdefault("max_radius_km", 50)
 
@@ -257,6 +338,24 @@ def _normalize_args(
     return args, meta
 
 
+def _breaker_open(tool: str) -> Optional[Dict[str, Any]]:
+    """Return a synthesized circuit_open result if `tool` is cooling down, else None."""
+    fails, reopen = _BREAKERS.get(tool, (0, 0.0))
+    now = time.monotonic()
+    if fails >= _BREAKER_THRESHOLD and now < reopen:
+        return {"error": "circuit_open", "retry_after": round(reopen - now, 2)}
+    return None
+
+
+def _breaker_failure(tool: str) -> None:
+    fails, _ = _BREAKERS.get(tool, (0, 0.0))
+    _BREAKERS[tool] = (fails + 1, time.monotonic() + _BREAKER_COOLDOWN_S)
+
+
+def _breaker_success(tool: str) -> None:
+    _BREAKERS.pop(tool, None)
+
+
 def _call_tool(fn: Any, args: Dict[str, Any]) -> Dict[str, Any]:
     """Support LC StructuredTool (.invoke), LC Tool (.run), or plain function(callable)."""
     if hasattr(fn, "invoke"):
@@ -272,6 +371,9 @@ def tools_node(state: PlannerState) -> PlannerState:
     
     # Create a temporary facts dict to store results as we go
     temp_facts = dict(state.facts) if hasattr(state, 'facts') else {}
+
+    # Resolve every distinct region needed by location-based tools up front (one geocode per region)
+    regions = _collect_regions(executed_calls, state.profile)
     
     # Special handling for geocode + location-based tools pattern
     # Check if we have geocode and any location-based tools in the same batch
@@ -292,12 +394,25 @@ def tools_node(state: PlannerState) -> PlannerState:
                 temp_facts["location"] = {"error": "Tool not found: geocode_tool"}
                 continue
 
+            tripped = _breaker_open("geocode_tool")
+            if tripped:
+                temp_facts["location"] = tripped
+                continue
+
             try:
                 result = _call_tool(tool_fn, call.args)
                 temp_facts["location"] = result
-            except Exception as exc:  # noqa: BLE001 broad to capture tool runtime
+                _breaker_success("geocode_tool")
+            except RETRYABLE as exc:
+                logger.warning("Tool %s failed (transient): %s", "geocode_tool", exc)
+                temp_facts["location"] = {"error": str(exc), "kind": "transient"}
+                _breaker_failure("geocode_tool")
+            except BAD_ARGS as exc:
+                logger.warning("Tool %s rejected args: %s", "geocode_tool", exc)
+                temp_facts["location"] = {"error": str(exc), "kind": "bad_args"}
+            except Exception as exc:  # noqa: BLE001
                 logger.exception("Tool %s failed", "geocode_tool")
-                temp_facts["location"] = {"error": str(exc)}
+                temp_facts["location"] = {"error": str(exc), "kind": "internal"}
                 
     # Process regional_crop_info calls first if we have both crop_info and prices_fetch
     if has_crop_info and has_prices:
@@ -308,14 +423,27 @@ def tools_node(state: PlannerState) -> PlannerState:
                 temp_facts["calendar"] = {"error": "Tool not found: regional_crop_info"}
                 continue
 
+            tripped = _breaker_open("regional_crop_info")
+            if tripped:
+                temp_facts["calendar"] = tripped
+                continue
+
             try:
                 # Normalize arguments with any existing temp_facts
                 norm_args, meta = _normalize_args(call.tool, call.args, state.profile, temp_facts)
                 result = _call_tool(tool_fn, norm_args)
                 temp_facts["calendar"] = result
+                _breaker_success("regional_crop_info")
+            except RETRYABLE as exc:
+                logger.warning("Tool %s failed (transient): %s", "regional_crop_info", exc)
+                temp_facts["calendar"] = {"error": str(exc), "kind": "transient"}
+                _breaker_failure("regional_crop_info")
+            except BAD_ARGS as exc:
+                logger.warning("Tool %s rejected args: %s", "regional_crop_info", exc)
+                temp_facts["calendar"] = {"error": str(exc), "kind": "bad_args"}
             except Exception as exc:  # noqa: BLE001
                 logger.exception("Tool %s failed", "regional_crop_info")
-                temp_facts["calendar"] = {"error": str(exc)}
+                temp_facts["calendar"] = {"error": str(exc), "kind": "internal"}
 
     try:
         for call in executed_calls:
@@ -334,40 +462,40 @@ def tools_node(state: PlannerState) -> PlannerState:
                 temp_facts[slot] = {"error": f"Tool not found: {tool_name}"}
                 continue
 
+            # Upstream known to be failing: skip the call instead of waiting on another timeout
+            tripped = _breaker_open(tool_name)
+            if tripped:
+                temp_facts[slot] = tripped
+                continue
+
             try:
                 args = dict(call.args)
                 meta = None  # Initialize meta variable
                 
                 # Special handling for location-based tools to use geocode results
                 if tool_name in LOCATION_BASED_TOOLS and "location" in temp_facts:
-                    raw_loc = temp_facts["location"]
-                    data_obj = raw_loc.get("data", {}) if isinstance(raw_loc, dict) else {}
-                    location_data: Dict[str, Any] = cast(Dict[str, Any], data_obj if isinstance(data_obj, dict) else {})
-                    if "lat" in location_data and "lon" in location_data:
-                        try:
-                            args["lat"] = float(location_data["lat"])  # type: ignore[index]
-                            args["lon"] = float(location_data["lon"])  # type: ignore[index]
-                            meta = {"geocode": temp_facts["location"]}
-                        except (TypeError, ValueError):  # fall back to enrichment if casting fails
-                            args, meta = _normalize_args(tool_name, args, state.profile)
-                    else:
-                        args, meta = _normalize_args(tool_name, args, state.profile)
+                    # EAFP: a missing/errored geocode result falls through to enrichment
+                    try:
+                        loc = temp_facts["location"]
+                        lat = float(loc["data"]["lat"])
+                        lon = float(loc["data"]["lon"])
+                        args["lat"], args["lon"] = lat, lon
+                        meta = {"geocode": loc}
+                    except (KeyError, TypeError, ValueError):
+                        args, meta = _normalize_args(tool_name, args, state.profile, regions=regions)
                 # Special handling for prices_fetch to use crop results
                 elif tool_name == "prices_fetch" and "calendar" in temp_facts:
-                    raw_cal = temp_facts["calendar"]
-                    data_obj = raw_cal.get("data", {}) if isinstance(raw_cal, dict) else {}
-                    calendar_data: Dict[str, Any] = cast(Dict[str, Any], data_obj if isinstance(data_obj, dict) else {})
-                    crops_val = calendar_data.get("crops") if isinstance(calendar_data, dict) else None
-                    if isinstance(crops_val, list) and crops_val and not args.get("commodity"):
-                        first = crops_val[0]
-                        first_crop = first.get("crop_name") if isinstance(first, dict) else None
-                        if first_crop:
-                            args["commodity"] = first_crop
-                            meta = {"auto_commodity_from_calendar": first_crop}
+                    try:
+                        first_crop = temp_facts["calendar"]["data"]["crops"][0]["crop_name"]
+                    except (KeyError, TypeError, IndexError):
+                        first_crop = None
+                    if first_crop and not args.get("commodity"):
+                        args["commodity"] = first_crop
+                        meta = {"auto_commodity_from_calendar": first_crop}
                     if not meta:
-                        args, meta = _normalize_args(tool_name, args, state.profile)
+                        args, meta = _normalize_args(tool_name, args, state.profile, regions=regions)
                 else:
-                    args, meta = _normalize_args(tool_name, args, state.profile)
+                    args, meta = _normalize_args(tool_name, args, state.profile, regions=regions)
                     
                 result = _call_tool(tool_fn, args)
 
@@ -380,20 +508,30 @@ def tools_node(state: PlannerState) -> PlannerState:
                         result["_meta"]["geocode"] = meta["geocode"]
 
                 temp_facts[slot] = result
-
+                _breaker_success(tool_name)
+
+            except RETRYABLE as exc:
+                logger.warning("Tool %s failed (transient): %s", tool_name, exc)
+                temp_facts[slot] = {"error": str(exc), "kind": "transient"}
+                _breaker_failure(tool_name)
+            except BAD_ARGS as exc:
+                logger.warning("Tool %s rejected args: %s", tool_name, exc)
+                temp_facts[slot] = {"error": str(exc), "kind": "bad_args"}
             except Exception as exc:  # noqa: BLE001
                 logger.exception("Tool %s failed", tool_name)
-                temp_facts[slot] = {"error": str(exc)}
+                temp_facts[slot] = {"error": str(exc), "kind": "internal"}
         
         # Update state.facts with all results
         state.facts = temp_facts
 
         # Retry pass: if geocode succeeded and any location-based tool slot holds an error complaining about lat/lon, auto-fill and retry once
         if has_geocode and "location" in temp_facts:
-            raw_loc = temp_facts.get("location")
-            loc_data = raw_loc.get("data") if isinstance(raw_loc, dict) else {}
-            loc_dict: Dict[str, Any] = cast(Dict[str, Any], loc_data if isinstance(loc_data, dict) else {})
-            if "lat" in loc_dict and "lon" in loc_dict:
+            try:
+                loc_data = temp_facts["location"]["data"]
+                loc_latlon: Optional[Tuple[float, float]] = (float(loc_data["lat"]), float(loc_data["lon"]))
+            except (KeyError, TypeError, ValueError):
+                loc_latlon = None
+            if loc_latlon is not None:
                 for lname in LOCATION_BASED_TOOLS:
                     slot = FACT_SLOT.get(lname, lname)
                     val = temp_facts.get(slot)
@@ -407,13 +545,10 @@ def tools_node(state: PlannerState) -> PlannerState:
                         tool_fn = TOOL_MAP.get(lname)
                         if not tool_fn:
                             continue
-                        try:
-                            retry_args = {
-                                "lat": float(loc_dict["lat"]),  # type: ignore[index]
-                                "lon": float(loc_dict["lon"]),  # type: ignore[index]
-                            }
-                        except (TypeError, ValueError):
+                        # an open circuit keeps the first attempt's error; don't bypass it
+                        if _breaker_open(lname):
                             continue
+                        retry_args: Dict[str, Any] = {"lat": loc_latlon[0], "lon": loc_latlon[1]}
                         try:
                             # preserve original days if present in original call
                             for oc in executed_calls:
@@ -421,8 +556,15 @@ def tools_node(state: PlannerState) -> PlannerState:
                                     retry_args["days"] = oc.args["days"]
                             result = _call_tool(tool_fn, retry_args)
                             temp_facts[slot] = result
+                            _breaker_success(lname)
+                        except RETRYABLE as rex:
+                            temp_facts[slot] = {"error": str(rex), "kind": "transient"}
+                            _breaker_failure(lname)
+                        except BAD_ARGS as rex:
+                            temp_facts[slot] = {"error": str(rex), "kind": "bad_args"}
                         except Exception as rex:  # noqa: BLE001
-                            temp_facts[slot] = {"error": str(rex)}
+                            logger.exception("Tool %s retry failed", lname)
+                            temp_facts[slot] = {"error": str(rex), "kind": "internal"}
                 state.facts = temp_facts
 
         # Mark executed; clear pending
@@ -430,7 +572,7 @@ def tools_node(state: PlannerState) -> PlannerState:
         state.pending_tool_calls.clear()
 
     except Exception as e:  # noqa: BLE001
-        logger.error(f"tools_node error: {e}")
+        logger.exception(f"tools_node error: {e}")
         # Always return a valid state
         state.facts = temp_facts
         state.tool_calls = state.tool_calls if hasattr(state, 'tool_calls') else []
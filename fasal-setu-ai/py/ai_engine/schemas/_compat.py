@@ -0,0 +1,34 @@
+"""Resolve graph.state models for both package and script-mode imports.
+
+Probes sys.modules / find_spec instead of a try/except import ladder, so a
+cold start does not raise and discard an ImportError per schema module.
+"""
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import sys
+from typing import Any, Iterator
+
+
+def _candidates() -> Iterator[str]:
+    pkg = __package__ or ""
+    if "." in pkg:  # package context, e.g. "ai_engine.schemas" -> "ai_engine.graph.state"
+        yield pkg.rsplit(".", 1)[0] + ".graph.state"
+    yield "graph.state"  # script context (running from inside ai_engine/)
+
+
+def resolve(name: str) -> Any:
+    """Return attribute `name` from the first importable graph.state module."""
+    for path in _candidates():
+        module = sys.modules.get(path)
+        if module is None:
+            try:
+                spec = importlib.util.find_spec(path)
+            except ModuleNotFoundError:  # parent package itself is not importable
+                spec = None
+            if spec is None:
+                continue
+            module = importlib.import_module(path)
+        return getattr(module, name)
+    raise ImportError(f"cannot resolve graph.state.{name}")
@@ -2,10 +2,9 @@ from typing import Any, Dict, List, Literal, Union
 
 from pydantic import BaseModel
 
-try:  # package import
-    from ..graph.state import Message  # type: ignore
-except Exception:  # fallback when run as script
-    from graph.state import Message  # type: ignore
+from ._compat import resolve
+
+Message = resolve("Message")
 
 
 class ActRequest(BaseModel):
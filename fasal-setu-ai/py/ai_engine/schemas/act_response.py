@@ -1,11 +1,10 @@
 from typing import Any, Dict, List
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, SkipValidation
 
-try:  # package context
-    from ..graph.state import ToolCall  # type: ignore
-except Exception:  # script context
-    from graph.state import ToolCall  # type: ignore
+from ._compat import resolve
+
+ToolCall = resolve("ToolCall")
 
 
 class ActResponse(BaseModel):
@@ -13,5 +12,5 @@ class ActResponse(BaseModel):
     decision_template: str
     missing: List[str] | None = None
     tool_calls: List[ToolCall] = Field(default_factory=list)
-    facts: Dict[str, Any]
+    facts: SkipValidation[Dict[str, Any]]  # raw tool payloads; can be large, nothing to check
     general_answer: str | None = None
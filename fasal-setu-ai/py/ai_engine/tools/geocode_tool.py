@@ -23,12 +23,28 @@ Note: Planner SHOULD still provide both district + state. Do NOT rely on state-o
 from __future__ import annotations
 
 import json
+import mmap
+import os
+import pickle
 import re
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional, Set, Tuple
 from difflib import get_close_matches
 
+try:
+    import orjson
+except Exception:
+    orjson = None  # stdlib json fallback
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+try:  # optional C++ fuzzy matcher; difflib is the fallback
+    from rapidfuzz import fuzz, process as rf_process
+except Exception:
+    rf_process = None
+
 try:  # standard package-relative
     from .paths import GEO_DIR  # type: ignore
 except Exception:  # fallback for script-mode execution
@@ -65,36 +81,54 @@ _DISTRICT_ALIASES = {
     "ahmadabad": "ahmedabad",
 }
 
-_WS = re.compile(r"\s+")
+# Any run of whitespace/punctuation collapses to one space
+_NORM_RE = re.compile(r"[^\w]+")
 
 
+@lru_cache(maxsize=4096)
 def _norm(s: Optional[str]) -> str:
     if not s:
         return ""
-    s = s.strip().lower()
-    s = _WS.sub(" ", s)
-    s = re.sub(r"[^\w\s]", " ", s)
-    s = _WS.sub(" ", s).strip()
-    return s
+    s = s.strip()
+    # Already canonical (lowercase ASCII words, single spaces) - common for planner args
+    if s.isascii() and s.islower() and s.replace(" ", "").isalnum() and "  " not in s:
+        return s
+    return _NORM_RE.sub(" ", s.lower()).strip()
 
 
+# Alias keys go through the same normalization as lookups, once at import;
+# the tables are frozen read-only views from then on
+_STATE_ALIASES = MappingProxyType({_norm(k): v for k, v in _STATE_ALIASES.items()})
+_DISTRICT_ALIASES = MappingProxyType({_norm(k): v for k, v in _DISTRICT_ALIASES.items()})
+
+
+# Memoized: ~700 dataset rows share a few dozen state names, and planner inputs repeat
+@lru_cache(maxsize=4096)
 def _alias_state(s: str) -> str:
     s = _norm(s)
     return _STATE_ALIASES.get(s, s)
 
 
+@lru_cache(maxsize=4096)
 def _alias_district(s: str) -> str:
     s = _norm(s)
     s = s.replace(" district", "").replace(" dist", "")
     return _DISTRICT_ALIASES.get(s, s)
 
 
-@lru_cache(maxsize=1)
-def _load_rows() -> List[Dict[str, Any]]:
+def _parse_geo_file(path: Path) -> Any:
+    """Parse the centroid file; with orjson, straight from an mmap (no read() copy)."""
+    if orjson is None or path.stat().st_size == 0:
+        return _loads(path.read_bytes())
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        with memoryview(mm) as view:
+            return orjson.loads(view)
+
+
+def _parse_rows() -> List[Dict[str, Any]]:
     if not DATA_PATH.exists():
         raise FileNotFoundError(f"Geo file not found: {DATA_PATH}")
-    with open(DATA_PATH, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = _parse_geo_file(DATA_PATH)
     # accept both {"records":[...]} and plain list [...]
     rows = data.get("records", data)
     if not isinstance(rows, list):
@@ -106,26 +140,133 @@ def _load_rows() -> List[Dict[str, Any]]:
     return rows
 
 
+def _build_indexes(rows: List[Dict[str, Any]]) -> Tuple[Dict[Tuple[str, str], Dict[str, Any]], Dict[str, List[Dict[str, Any]]]]:
+    """(state_norm, district_norm) -> row and district_norm -> rows, in dataset order."""
+    by_pair: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    by_district: Dict[str, List[Dict[str, Any]]] = {}
+    for r in rows:
+        by_pair.setdefault((r["_state_norm"], r["_district_norm"]), r)
+        by_district.setdefault(r["_district_norm"], []).append(r)
+    return by_pair, by_district
+
+
+# Side-car snapshot of the normalized rows + indexes, reused while newer than the JSON.
+# The alias tables are part of the key: editing them invalidates the snapshot.
+SNAPSHOT_PATH = DATA_PATH.with_suffix(".normalized.pkl")
+_SNAPSHOT_KEY = (1, sorted(_STATE_ALIASES.items()), sorted(_DISTRICT_ALIASES.items()))
+
+
+def _read_snapshot() -> Optional[Tuple[Any, ...]]:
+    try:
+        if SNAPSHOT_PATH.stat().st_mtime_ns < DATA_PATH.stat().st_mtime_ns:
+            return None
+        with open(SNAPSHOT_PATH, "rb") as f:
+            key, payload = pickle.load(f)
+    except (OSError, EOFError, ValueError, TypeError, pickle.UnpicklingError):
+        return None
+    return payload if key == _SNAPSHOT_KEY else None
+
+
+def _write_snapshot(payload: Tuple[Any, ...]) -> None:
+    tmp = SNAPSHOT_PATH.with_suffix(f".tmp{os.getpid()}")
+    try:
+        with open(tmp, "wb") as f:
+            pickle.dump((_SNAPSHOT_KEY, payload), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, SNAPSHOT_PATH)  # atomic: readers never see a partial file
+    except OSError:
+        tmp.unlink(missing_ok=True)  # read-only deploys just skip the snapshot
+
+
+@lru_cache(maxsize=1)
+def _dataset() -> Tuple[List[Dict[str, Any]], Dict[Tuple[str, str], Dict[str, Any]], Dict[str, List[Dict[str, Any]]]]:
+    """(rows, by_pair, by_district): from the snapshot when fresh, else parsed and snapshotted."""
+    cached = _read_snapshot()
+    if cached is not None:
+        return cached  # type: ignore[return-value]
+    rows = _parse_rows()
+    payload = (rows, *_build_indexes(rows))
+    _write_snapshot(payload)
+    return payload  # type: ignore[return-value]
+
+
+def _load_rows() -> List[Dict[str, Any]]:
+    return _dataset()[0]
+
+
+def warmup() -> None:
+    """Load (or snapshot) the centroid dataset ahead of the first request."""
+    _dataset()
+
+
+def _indexes() -> Tuple[Dict[Tuple[str, str], Dict[str, Any]], Dict[str, List[Dict[str, Any]]]]:
+    """(state_norm, district_norm) -> row and district_norm -> rows, in dataset order."""
+    _, by_pair, by_district = _dataset()
+    return by_pair, by_district
+
+
+@lru_cache(maxsize=1)
+def _all_districts() -> Tuple[str, ...]:
+    """Fuzzy-match candidates: every normalized district name (dataset order)."""
+    return tuple(_indexes()[1])
+
+
+def _trigrams(s: str) -> Set[str]:
+    s = f"  {s} "  # padded so short names and word edges still yield grams
+    return {s[i:i + 3] for i in range(len(s) - 2)}
+
+
+@lru_cache(maxsize=1)
+def _trigram_index() -> Dict[str, Tuple[int, ...]]:
+    """Trigram -> positions in ``_all_districts()``; narrows fuzzy candidates before scoring."""
+    idx: Dict[str, List[int]] = {}
+    for i, name in enumerate(_all_districts()):
+        for g in _trigrams(name):
+            idx.setdefault(g, []).append(i)
+    return {g: tuple(ids) for g, ids in idx.items()}
+
+
+def _fuzzy_candidates(d: str, min_shared: int = 2) -> List[str]:
+    """Districts sharing >= ``min_shared`` trigrams with ``d``, in dataset order.
+
+    Anything scoring above the 0.88 cutoff differs by at most an edit or two, which
+    leaves well over two padded trigrams in common, so the prefilter drops no hits.
+    """
+    idx = _trigram_index()
+    counts: Dict[int, int] = {}
+    for g in _trigrams(d):
+        for i in idx.get(g, ()):
+            counts[i] = counts.get(i, 0) + 1
+    names = _all_districts()
+    return [names[i] for i in sorted(i for i, c in counts.items() if c >= min_shared)]
+
+
+def _closest_district(d: str, cutoff: float = 0.88) -> Optional[str]:
+    choices = _fuzzy_candidates(d)
+    if not choices:
+        return None
+    if rf_process is not None:
+        hit = rf_process.extractOne(d, choices, scorer=fuzz.ratio, score_cutoff=cutoff * 100)
+        return hit[0] if hit else None
+    close = get_close_matches(d, choices, n=1, cutoff=cutoff)
+    return close[0] if close else None
+
+
 def _find_exact(state: str, district: str) -> Optional[Dict[str, Any]]:
-    s, d = _alias_state(state), _alias_district(district)
-    for r in _load_rows():
-        if r["_state_norm"] == s and r["_district_norm"] == d:
-            return r
-    return None
+    return _indexes()[0].get((_alias_state(state), _alias_district(district)))
 
 
+@lru_cache(maxsize=1024)
 def _best_by_district_only(district: str) -> Optional[Tuple[Dict[str, Any], float]]:
+    # Pure function of the (static) dataset: repeat misspellings skip the fuzzy pass
     d = _alias_district(district)
-    cand = [r for r in _load_rows() if r["_district_norm"] == d]
+    by_district = _dataset()[2]
+    cand = by_district.get(d)
     if cand:
         return cand[0], 0.80  # ambiguous but exact district string
     # fuzzy on district
-    all_d = list({r["_district_norm"] for r in _load_rows()})
-    close = get_close_matches(d, all_d, n=1, cutoff=0.88)
+    close = _closest_district(d)
     if close:
-        for r in _load_rows():
-            if r["_district_norm"] == close[0]:
-                return r, 0.70
+        return by_district[close][0], 0.70
     return None
 
 
@@ -8,14 +8,37 @@ from __future__ import annotations
 import os
 import json
 import time
+import hashlib
 import pathlib
-from datetime import date
-from typing import Any, Dict, List, Optional, Iterable
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Any, Dict, List, NamedTuple, Optional, Iterable, Tuple
 
 import requests
-from pydantic import BaseModel, Field, field_validator  # Pydantic v2
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from pydantic import BaseModel, Field, PrivateAttr, field_validator, model_validator  # Pydantic v2
 from dateutil import parser as dateparser
 
+try:  # optional C ISO-8601 parser; strptime/dateutil are the fallback
+    import ciso8601
+except Exception:
+    ciso8601 = None
+
+try:
+    import orjson
+except Exception:
+    orjson = None  # stdlib json fallback
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+try:  # optional: vectorized column means
+    import numpy as np
+except Exception:
+    np = None  # pure-Python _avg fallback
+
 try:
     from langchain_core.tools import StructuredTool
 except Exception:
@@ -32,7 +55,13 @@ OGD_BASE = "https://api.data.gov.in/resource/"
 OGD_API_KEY = os.getenv("DATA_GOV_IN_API_KEY", "").strip()
 
 API_LIMIT = 500
-API_SLEEP = 0.25  # polite paging delay
+API_SLEEP = 0.05  # polite paging delay (pages reuse one keep-alive connection)
+# Opt-in: after the first page, fetch the remaining offsets concurrently
+PARALLEL_PAGES = os.getenv("MANDI_PARALLEL_PAGES", "0") == "1"
+PAGE_WORKERS = 4
+# On-disk cache of OGD pages (prices update at most daily); MANDI_CACHE_TTL_HOURS=0 disables it
+CACHE_DIR = pathlib.Path(os.getenv("MANDI_CACHE_DIR", "~/.cache/fasal-setu/ogd")).expanduser()
+CACHE_TTL_HOURS = float(os.getenv("MANDI_CACHE_TTL_HOURS", "12"))
 
 # Static fallback directory (files already in target schema)
 STATIC_DIR = pathlib.Path(__file__).resolve().parent.parent.parent.parent / "data" / "static_json" / "mandi"
@@ -52,11 +81,17 @@ ALIASES = {
     },
 }
 
+# (kind, lowercased alias) -> canonical: one lookup instead of two nested ones
+_FLAT_ALIASES = {(kind, k.lower()): v for kind, sub in ALIASES.items() for k, v in sub.items()}
+
+@lru_cache(maxsize=256)
 def _canon(val: Optional[str], kind: str) -> Optional[str]:
     if val is None:
         return None
-    key = val.strip().lower()
-    return ALIASES.get(kind, {}).get(key, val)
+    return _FLAT_ALIASES.get((kind, val.strip().lower()), val)
+
+def _lc(x: Optional[str]) -> str:
+    return (x or "").strip().lower()
 
 def _norm_str(x: Any) -> Optional[str]:
     if x is None:
@@ -72,42 +107,96 @@ def _to_float(x: Any) -> Optional[float]:
     except Exception:
         return None
 
-def _in_date_range(d: Optional[str], start: Optional[str], end: Optional[str]) -> bool:
+# Formats seen in OGD/static mandi data (ISO, and day-first dd/mm/yyyy from the gov.in feed)
+_DATE_FORMATS = ("%Y-%m-%d", "%d-%m-%Y", "%Y/%m/%d", "%d/%m/%Y")
+
+def _fast_parse_date(s: str) -> date:
+    """Parse a mandi date: ciso8601 for ISO, then strptime on the known formats, dateutil last."""
+    s = s.strip()
+    if ciso8601 is not None:
+        try:
+            return ciso8601.parse_datetime_as_naive(s).date()
+        except ValueError:
+            pass
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(s, fmt).date()
+        except ValueError:
+            continue
+    return dateparser.parse(s).date()
+
+def _date_bounds(args: "MandiArgs") -> Tuple[Optional[date], Optional[date]]:
+    """(start, end) of the query window as dates, parsed once per query rather than per row."""
+    sd = _fast_parse_date(args.start_date) if args.start_date else None
+    ed = _fast_parse_date(args.end_date) if args.end_date else None
+    return sd, ed
+
+def _in_date_range_fast(d: Optional[str], start: Optional[date], end: Optional[date]) -> bool:
     if not d:
         return False
-    dd = dateparser.parse(d).date()
-    if start and dd < dateparser.parse(start).date():
+    dd = _fast_parse_date(d)
+    if start and dd < start:
         return False
-    if end and dd > dateparser.parse(end).date():
+    if end and dd > end:
         return False
     return True
 
+def _in_date_range(d: Optional[str], start: Optional[str], end: Optional[str]) -> bool:
+    return _in_date_range_fast(
+        d,
+        _fast_parse_date(start) if start else None,
+        _fast_parse_date(end) if end else None,
+    )
+
 def _avg(values: Iterable[Optional[float]]) -> Optional[float]:
     nums = [v for v in values if isinstance(v, (int, float))]
     return (sum(nums) / len(nums)) if nums else None
 
+PRICE_FIELDS = ("min_price_rs_per_qtl", "max_price_rs_per_qtl", "modal_price_rs_per_qtl", "arrival_qty")
+
+def _price_columns(rows: List[Dict[str, Any]]) -> Dict[str, List[Optional[float]]]:
+    """Transpose row dicts into one column per numeric price field (single pass over rows)."""
+    cols: Dict[str, List[Optional[float]]] = {k: [] for k in PRICE_FIELDS}
+    for r in rows:
+        for k in PRICE_FIELDS:
+            cols[k].append(_to_float(r.get(k)))
+    return cols
+
+def _column_averages(rows: List[Dict[str, Any]], parsed: bool = False) -> Dict[str, Optional[float]]:
+    """Mean of each PRICE_FIELDS column, ignoring missing values (None when a column has none).
+
+    ``parsed`` rows come from _map_api_row_to_schema and already hold float/None,
+    so the _to_float re-parse is skipped for them.
+    """
+    if parsed:
+        cols = {k: [r.get(k) for r in rows] for k in PRICE_FIELDS}
+    else:
+        cols = _price_columns(rows)
+    return _averages(cols)
+
+def _averages(cols: Dict[str, List[Optional[float]]]) -> Dict[str, Optional[float]]:
+    """Per-column mean of already-parsed values, skipping None."""
+    if np is None:
+        return {k: _avg(col) for k, col in cols.items()}
+    arr = np.array(list(cols.values()), dtype=np.float64)  # (fields, rows); None -> nan
+    valid = ~np.isnan(arr)
+    counts = valid.sum(axis=1)
+    sums = np.where(valid, arr, 0.0).sum(axis=1)
+    return {k: (float(sums[i] / counts[i]) if counts[i] else None) for i, k in enumerate(cols)}
+
+_MEANINGFUL_KEYS = (
+    "state","district","market","arrival_date","commodity","variety",
+    "min_price_rs_per_qtl","max_price_rs_per_qtl","modal_price_rs_per_qtl","arrival_qty"
+)
+_NULLISH = (None, "", "null")
+
 def _is_effectively_null(row: Dict[str, Any]) -> bool:
     """True if all meaningful fields are None/empty (ignores source_url/last_checked)."""
-    keys = [
-        "state","district","market","arrival_date","commodity","variety",
-        "min_price_rs_per_qtl","max_price_rs_per_qtl","modal_price_rs_per_qtl","arrival_qty"
-    ]
-    for k in keys:
-        v = row.get(k)
-        if v not in (None, "", "null"):
+    for k in _MEANINGFUL_KEYS:
+        if row.get(k) not in _NULLISH:
             return False
     return True
 
-@field_validator("state", "district", "commodity", "market", "variety")
-@classmethod
-def _canon_fields(cls, v, info):
-    if v is None:
-        return v
-    kind = info.field_name  # 'state' | 'district' | ...
-    if kind in ("district", "commodity"):
-        return _canon(v, kind)
-    return v
-
 
 # ----------------------------
 # Input model
@@ -122,12 +211,36 @@ class MandiArgs(BaseModel):
     end_date: Optional[str] = Field(None, description="YYYY-MM-DD (inclusive)")
     max_rows: int = Field(1000, description="Row cap")
 
+    @field_validator("state", "district", "commodity", "market", "variety")
+    @classmethod
+    def _canon_fields(cls, v, info):
+        if v is None:
+            return v
+        kind = info.field_name  # 'state' | 'district' | ...
+        if kind in ("district", "commodity"):
+            return _canon(v, kind)
+        return v
+
     @field_validator("start_date", "end_date")
     @classmethod
     def _fmt_date(cls, v: Optional[str]) -> Optional[str]:
         if v is None:
             return v
-        return dateparser.parse(v).date().isoformat()
+        return _fast_parse_date(v).isoformat()
+
+    # Stripped/lowercased filter values, computed once per query instead of once per row
+    _state_lc: str = PrivateAttr("")
+    _district_lc: str = PrivateAttr("")
+    _commodity_lc: str = PrivateAttr("")
+    _market_lc: str = PrivateAttr("")
+
+    @model_validator(mode="after")
+    def _lowercase_filters(self) -> "MandiArgs":
+        self._state_lc = _lc(self.state)
+        self._district_lc = _lc(self.district)
+        self._commodity_lc = _lc(self.commodity)
+        self._market_lc = _lc(self.market)
+        return self
 
 # ----------------------------
 # Mapping (API raw -> schema)
@@ -151,6 +264,20 @@ def _map_api_row_to_schema(rec: Dict[str, Any], source_url: str) -> Dict[str, An
 # ----------------------------
 # API fetch (data.gov.in)
 # ----------------------------
+def _make_session() -> requests.Session:
+    """Keep-alive session: pages after the first skip the TCP+TLS handshake.
+
+    Transient gateway errors are retried with backoff; the final response is
+    still returned (not raised) so _api_get can try its alternate key param.
+    """
+    retry = Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504],
+                  allowed_methods=["GET"], raise_on_status=False)
+    s = requests.Session()
+    s.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry))
+    return s
+
+_SESSION = _make_session()
+
 def _api_get(base_url: str, params: Dict[str, Any], timeout: int = 30) -> Dict[str, Any]:
     """
     Calls data.gov.in endpoint. Tries 'api-key' first, then 'api_key' if needed.
@@ -163,19 +290,96 @@ def _api_get(base_url: str, params: Dict[str, Any], timeout: int = 30) -> Dict[s
     p1 = dict(params)
     p1["api-key"] = OGD_API_KEY
 
-    r = requests.get(base_url, params=p1, timeout=timeout)
+    r = _SESSION.get(base_url, params=p1, timeout=timeout)
     if r.status_code == 200:
         try:
-            return r.json()
+            return _loads(r.content)  # orjson straight from bytes; skips requests' charset probe
         except Exception:
             pass
 
     # fallback: 'api_key'
     p2 = dict(params)
     p2["api_key"] = OGD_API_KEY
-    r2 = requests.get(base_url, params=p2, timeout=timeout)
+    r2 = _SESSION.get(base_url, params=p2, timeout=timeout)
     r2.raise_for_status()
-    return r2.json()
+    return _loads(r2.content)
+
+def _cached_api_get(base_url: str, params: Dict[str, Any], timeout: int = 30) -> Dict[str, Any]:
+    """_api_get through a per-day file cache under CACHE_DIR (key excludes the api key).
+
+    Pages without records are not cached, so data posted later in the day is still picked up.
+    """
+    if CACHE_TTL_HOURS <= 0:
+        return _api_get(base_url, params, timeout)
+    frozen = {k: v for k, v in params.items() if k not in ("api-key", "api_key")}
+    key = hashlib.sha1(
+        json.dumps([base_url, frozen, date.today().isoformat()], sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+    path = CACHE_DIR / f"{key}.json"
+    try:
+        if time.time() - path.stat().st_mtime < CACHE_TTL_HOURS * 3600:
+            return _loads(path.read_bytes())
+    except (OSError, ValueError):
+        pass  # missing, stale or unreadable: fetch
+
+    payload = _api_get(base_url, params, timeout)
+    if payload.get("records") or payload.get("data"):
+        tmp = path.with_suffix(f".tmp{os.getpid()}.{threading.get_ident()}")
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(payload), encoding="utf-8")
+            os.replace(tmp, path)  # atomic: concurrent readers never see a partial file
+        except (OSError, TypeError, ValueError):
+            tmp.unlink(missing_ok=True)  # unwritable cache dir just skips caching
+    return payload
+
+def _page_records(base_url: str, params: Dict[str, Any], args: MandiArgs) -> List[Dict[str, Any]]:
+    """Page through the OGD resource, keeping in-window records until ``args.max_rows``.
+
+    With MANDI_PARALLEL_PAGES=1 the first page's ``total`` is used to fetch the
+    remaining offsets concurrently; records are still consumed in offset order.
+    """
+    sd, ed = _date_bounds(args)
+    all_records: List[Dict[str, Any]] = []
+
+    def _take(batch: List[Dict[str, Any]]) -> bool:
+        """Append in-window records from a page; True once max_rows is reached."""
+        for rec in batch:
+            d = rec.get("arrival_date") or rec.get("date") or rec.get("Date")
+            if (sd or ed) and not _in_date_range_fast(d, sd, ed):
+                continue
+            all_records.append(rec)
+            if len(all_records) >= args.max_rows:
+                return True
+        return False
+
+    while True:
+        payload = _cached_api_get(base_url, params, timeout=30)
+        batch = payload.get("records") or payload.get("data") or []
+        if not batch or _take(batch):
+            break
+
+        params["offset"] = params.get("offset", 0) + params["limit"]
+        if len(batch) < params["limit"]:
+            break
+
+        total = _to_float(payload.get("total"))
+        if PARALLEL_PAGES and total:
+            # a date window can drop rows, so only an unfiltered fetch may stop at max_rows
+            stop = int(total) if (sd or ed) else min(int(total), args.max_rows)
+            offsets = range(params["offset"], stop, params["limit"])
+            with ThreadPoolExecutor(max_workers=PAGE_WORKERS) as pool:
+                futures = [pool.submit(_cached_api_get, base_url, {**params, "offset": off}, 30) for off in offsets]
+                for fut in futures:
+                    page = fut.result()
+                    batch = page.get("records") or page.get("data") or []
+                    if not batch or _take(batch) or len(batch) < params["limit"]:
+                        break
+                for fut in futures:
+                    fut.cancel()
+            break
+        time.sleep(API_SLEEP)
+    return all_records
 
 def _ogd_api_fetch(args: MandiArgs) -> Dict[str, Any]:
     if not OGD_API_KEY:
@@ -198,28 +402,7 @@ def _ogd_api_fetch(args: MandiArgs) -> Dict[str, Any]:
     if args.variety:
         params["filters[variety]"] = args.variety
 
-    all_records: List[Dict[str, Any]] = []
-    while True:
-        payload = _api_get(base_url, params, timeout=30)
-        batch = payload.get("records") or payload.get("data") or []
-        if not batch:
-            break
-
-        for rec in batch:
-            d = rec.get("arrival_date") or rec.get("date") or rec.get("Date")
-            if (args.start_date or args.end_date) and not _in_date_range(d, args.start_date, args.end_date):
-                continue
-            all_records.append(rec)
-            if len(all_records) >= args.max_rows:
-                break
-
-        if len(all_records) >= args.max_rows:
-            break
-
-        params["offset"] = params.get("offset", 0) + params["limit"]
-        if len(batch) < params["limit"]:
-            break
-        time.sleep(API_SLEEP)
+    all_records = _page_records(base_url, params, args)
 
     mapped = [_map_api_row_to_schema(r, base_url) for r in all_records[: args.max_rows]]
 
@@ -244,28 +427,7 @@ def _ogd_api_state_rollup(args: MandiArgs) -> Optional[Dict[str, Any]]:
         # intentionally omit district/market
     }
 
-    all_records: List[Dict[str, Any]] = []
-    while True:
-        payload = _api_get(base_url, params, timeout=30)
-        batch = payload.get("records") or payload.get("data") or []
-        if not batch:
-            break
-
-        for rec in batch:
-            d = rec.get("arrival_date") or rec.get("date") or rec.get("Date")
-            if (args.start_date or args.end_date) and not _in_date_range(d, args.start_date, args.end_date):
-                continue
-            all_records.append(rec)
-            if len(all_records) >= args.max_rows:
-                break
-
-        if len(all_records) >= args.max_rows:
-            break
-
-        params["offset"] = params.get("offset", 0) + params["limit"]
-        if len(batch) < params["limit"]:
-            break
-        time.sleep(API_SLEEP)
+    all_records = _page_records(base_url, params, args)
 
     if not all_records:
         return None
@@ -283,7 +445,7 @@ def _ogd_api_state_rollup(args: MandiArgs) -> Optional[Dict[str, Any]]:
         if not d:
             continue
         try:
-            dd = dateparser.parse(d).date()
+            dd = _fast_parse_date(d)
             if latest_date is None or dd > latest_date:
                 latest_date = dd
         except Exception:
@@ -296,10 +458,7 @@ def _ogd_api_state_rollup(args: MandiArgs) -> Optional[Dict[str, Any]]:
         "arrival_date": latest_date.isoformat() if latest_date else None,
         "commodity": args.commodity,
         "variety": None,
-        "min_price_rs_per_qtl": _avg([_to_float(m.get("min_price_rs_per_qtl")) for m in mapped]),
-        "max_price_rs_per_qtl": _avg([_to_float(m.get("max_price_rs_per_qtl")) for m in mapped]),
-        "modal_price_rs_per_qtl": _avg([_to_float(m.get("modal_price_rs_per_qtl")) for m in mapped]),
-        "arrival_qty": _avg([_to_float(m.get("arrival_qty")) for m in mapped]),
+        **_column_averages(mapped, parsed=True),
         "source_url": f"state-average(api gov.in): {base_url}?state={args.state}&commodity={args.commodity}",
         "last_checked": date.today().isoformat(),
     }
@@ -308,14 +467,46 @@ def _ogd_api_state_rollup(args: MandiArgs) -> Optional[Dict[str, Any]]:
 # ----------------------------
 # Static fallback (already in target schema)
 # ----------------------------
-def _load_static() -> List[Dict[str, Any]]:
+class _Slice(NamedTuple):
+    """Static rows sharing one (state, commodity), with their filter columns computed at load."""
+    rows: List[Dict[str, Any]]
+    district: List[str]            # stripped + lowercased
+    market: List[Optional[str]]    # None when the row has no market (never filtered out on it)
+    arrival: List[Any]             # date; None when missing; the raw value when unparseable
+    prices: Dict[str, List[Optional[float]]]  # PRICE_FIELDS columns, parsed via _to_float
+
+StaticPack = Tuple[List[Dict[str, Any]], Dict[Tuple[str, str], _Slice], Dict[str, List[Dict[str, Any]]]]
+
+def _static_pack() -> StaticPack:
+    """(rows, by (state, commodity), by state); re-read only when a file in STATIC_DIR (or the dir itself) changes."""
     if not STATIC_DIR.exists():
-        return []
+        return [], {}, {}
+    files = list(STATIC_DIR.glob("*.json"))
+    key = (STATIC_DIR.stat().st_mtime_ns, max((fp.stat().st_mtime_ns for fp in files), default=0))
+    return _load_static_cached(key)
+
+def _load_static() -> List[Dict[str, Any]]:
+    return _static_pack()[0]
+
+def _arrival_column(d: Any) -> Any:
+    if not d:
+        return None
+    try:
+        return _fast_parse_date(d)
+    except Exception:
+        return d  # re-parsed (and raised) only if a query filters on dates
+
+@lru_cache(maxsize=1)
+def _load_static_cached(key: Tuple[int, int]) -> StaticPack:
+    """Parse every static pack file and index it; ``key`` is only the mtime stamp that invalidates the cache.
+
+    Index keys are lowercased/stripped state and commodity; lists keep file order.
+    Rows are shared between calls: copy before adding per-response fields.
+    """
     rows: List[Dict[str, Any]] = []
     for fp in STATIC_DIR.glob("*.json"):
         try:
-            with open(fp, "r", encoding="utf-8") as f:
-                obj = json.load(f)
+            obj = _loads(fp.read_bytes())
         except Exception:
             continue
         if isinstance(obj, list):
@@ -324,50 +515,80 @@ def _load_static() -> List[Dict[str, Any]]:
             data = obj.get("data") or obj.get("records") or []
             if isinstance(data, list):
                 rows.extend(data)
-    return rows
+    by_state_commodity: Dict[Tuple[str, str], _Slice] = {}
+    by_state: Dict[str, List[Dict[str, Any]]] = {}
+    for r in rows:
+        st = _lc(r.get("state"))
+        key = (st, _lc(r.get("commodity")))
+        sl = by_state_commodity.get(key)
+        if sl is None:
+            sl = by_state_commodity[key] = _Slice([], [], [], [], {})
+        sl.rows.append(r)
+        sl.district.append(_lc(r.get("district")))
+        sl.market.append(_lc(r.get("market")) if r.get("market") else None)
+        sl.arrival.append(_arrival_column(r.get("arrival_date")))
+        by_state.setdefault(st, []).append(r)
+    for sl in by_state_commodity.values():
+        sl.prices.update(_price_columns(sl.rows))
+    return rows, by_state_commodity, by_state
+
+def _filter_slice(sl: _Slice, args: MandiArgs) -> List[Dict[str, Any]]:
+    """_filter_static over one indexed slice, comparing against its precomputed columns."""
+    sd, ed = _date_bounds(args)
+    district = args._district_lc if args.district else None
+    market = args._market_lc if args.market else None
+    out = []
+    for r, dist, mkt, arr in zip(sl.rows, sl.district, sl.market, sl.arrival):
+        if district is not None and dist != district:
+            continue
+        if market is not None and mkt is not None and mkt != market:
+            continue
+        if sd or ed:
+            if arr is None:
+                continue
+            if not isinstance(arr, date):
+                _fast_parse_date(arr)  # unparseable: raise as the per-row parse always did
+            if (sd and arr < sd) or (ed and arr > ed):
+                continue
+
+        # ensure housekeeping fields (on a copy: rows belong to the static cache)
+        r = dict(r)
+        r.setdefault("last_checked", date.today().isoformat())
+        r.setdefault("source_url", str(STATIC_DIR.resolve()))
+        out.append(r)
+    return out
 
 def _filter_static(rows: List[Dict[str, Any]], args: MandiArgs) -> List[Dict[str, Any]]:
+    sd, ed = _date_bounds(args)
     out = []
     for r in rows:
-        if args.state and (r.get("state") or "").strip().lower() != args.state.strip().lower():
+        if args.state and _lc(r.get("state")) != args._state_lc:
             continue
         if args.district:
-            if (r.get("district") or "").strip().lower() != args.district.strip().lower():
+            if _lc(r.get("district")) != args._district_lc:
                 continue
-        if args.commodity and (r.get("commodity") or "").strip().lower() != args.commodity.strip().lower():
+        if args.commodity and _lc(r.get("commodity")) != args._commodity_lc:
             continue
         if args.market and r.get("market"):
-            if (r.get("market") or "").strip().lower() != args.market.strip().lower():
+            if _lc(r.get("market")) != args._market_lc:
                 continue
-        if (args.start_date or args.end_date) and not _in_date_range(r.get("arrival_date"), args.start_date, args.end_date):
+        if (sd or ed) and not _in_date_range_fast(r.get("arrival_date"), sd, ed):
             continue
 
-        # ensure housekeeping fields
+        # ensure housekeeping fields (on a copy: rows belong to the static cache)
+        r = dict(r)
         r.setdefault("last_checked", date.today().isoformat())
         r.setdefault("source_url", str(STATIC_DIR.resolve()))
         out.append(r)
     return out
 
-def _state_average(rows: List[Dict[str, Any]], state: str, commodity: str) -> Optional[Dict[str, Any]]:
-    cand = [
-        r for r in rows
-        if (r.get("state") or "").strip().lower() == state.strip().lower()
-        and (r.get("commodity") or "").strip().lower() == commodity.strip().lower()
-    ]
-    if not cand:
+def _state_average(sl: _Slice, state: str, commodity: str) -> Optional[Dict[str, Any]]:
+    """Average of the static rows matched on (state, commodity), from their load-time columns."""
+    if not sl.rows:
         return None
 
-    latest_date = None
-    for r in cand:
-        d = r.get("arrival_date")
-        if not d:
-            continue
-        try:
-            dd = dateparser.parse(d).date()
-            if latest_date is None or dd > latest_date:
-                latest_date = dd
-        except Exception:
-            continue
+    # latest date in the slice (unparseable dates were kept raw and are skipped)
+    latest_date = max((d for d in sl.arrival if isinstance(d, date)), default=None)
 
     return {
         "state": state,
@@ -376,36 +597,32 @@ def _state_average(rows: List[Dict[str, Any]], state: str, commodity: str) -> Op
         "arrival_date": latest_date.isoformat() if latest_date else None,
         "commodity": commodity,
         "variety": None,
-        "min_price_rs_per_qtl": _avg([_to_float(r.get("min_price_rs_per_qtl")) for r in cand]),
-        "max_price_rs_per_qtl": _avg([_to_float(r.get("max_price_rs_per_qtl")) for r in cand]),
-        "modal_price_rs_per_qtl": _avg([_to_float(r.get("modal_price_rs_per_qtl")) for r in cand]),
-        "arrival_qty": _avg([_to_float(r.get("arrival_qty")) for r in cand]),
+        **_averages(sl.prices),
         "source_url": f"state-average(static gov.in): {STATIC_DIR.resolve()}?state={state}&commodity={commodity}",
         "last_checked": date.today().isoformat(),
     }
 
 def _static_fallback(args: MandiArgs) -> Dict[str, Any]:
-    rows = _load_static()
+    rows, by_state_commodity, by_state = _static_pack()
     if not rows:
         return {"data": [], "source_stamp": str(STATIC_DIR.resolve())}
 
-    dist_rows = _filter_static(rows, args)
+    sl = by_state_commodity.get((args._state_lc, args._commodity_lc), _Slice([], [], [], [], {}))
+    # an empty state/commodity arg means "no filter" in _filter_static, so scan everything then
+    dist_rows = _filter_slice(sl, args) if args.state and args.commodity else _filter_static(rows, args)
     if dist_rows:
         return {"data": dist_rows[: args.max_rows], "source_stamp": str(STATIC_DIR.resolve())}
 
-    state_avg = _state_average(rows, args.state, args.commodity)
+    state_avg = _state_average(sl, args.state, args.commodity)
     if state_avg:
         return {"data": [state_avg], "source_stamp": state_avg["source_url"]}
 
     # last resort: any state rows regardless of commodity
-    state_only = [
-        r for r in rows
-        if (r.get("state") or "").strip().lower() == args.state.strip().lower()
-    ]
+    state_only = [dict(r) for r in by_state.get(args._state_lc, [])[: args.max_rows]]
     for r in state_only:
         r.setdefault("last_checked", date.today().isoformat())
         r.setdefault("source_url", str(STATIC_DIR.resolve()))
-    return {"data": state_only[: args.max_rows], "source_stamp": str(STATIC_DIR.resolve())}
+    return {"data": state_only, "source_stamp": str(STATIC_DIR.resolve())}
 
 # ----------------------------
 # Public entry
@@ -54,11 +54,20 @@ Return envelope:
 
 from __future__ import annotations
 
+import heapq
 import json
 import os
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+try:
+    import orjson
+except Exception:
+    orjson = None  # stdlib json fallback
+
+_loads = orjson.loads if orjson is not None else json.loads
 
 try:
     from .paths import PESTICIDES_DIR  # type: ignore
@@ -83,8 +92,8 @@ def _is_bio_file(fname: str) -> bool:
 
 def _load_json_file(path: str) -> List[Dict[str, Any]]:
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(path, "rb") as f:
+            data = _loads(f.read())
         if isinstance(data, list):
             return data
         if isinstance(data, dict):
@@ -94,42 +103,94 @@ def _load_json_file(path: str) -> List[Dict[str, Any]]:
     except Exception:
         return []
 
-def _scan_files(category: Optional[str], bio_only: bool, chemical_only: bool) -> Tuple[List[str], List[Dict[str, Any]]]:
-    """Return (files_scanned, entries)."""
-    if not os.path.isdir(DATA_DIR):
-        return [], []
+class _Entry(NamedTuple):
+    """A pack record (plus source_file) with its filter fields lowercased once at load.
 
-    # build candidate file list
-    all_files = [f for f in os.listdir(DATA_DIR) if f.endswith(".json")]
-    # basic exclusions
-    exclude = {"sources.json", ".keep"}
-    all_files = [f for f in all_files if f not in exclude]
+    ``row`` is shared by every lookup against the cached pack: copy it before returning.
+    """
+    row: Dict[str, Any]
+    crop: Any
+    target: Any
+    ai: Any
+    form: Any
+    who: Any
+    status: Any
+    rank: Tuple[int, float, int]  # _rank_key(row), parsed once
+
+def _lc(x: Any) -> Any:
+    # non-string values stay raw (and fail at match time, like _canon would)
+    return _canon(x) if x is None or isinstance(x, str) else x
+
+def _pack_stamp() -> Optional[Tuple[int, int]]:
+    """(dir mtime, newest *.json mtime); changes whenever a pack file is added, removed or edited."""
+    try:
+        with os.scandir(DATA_DIR) as it:
+            newest = max((e.stat().st_mtime_ns for e in it if e.name.endswith(".json")), default=0)
+        return os.stat(DATA_DIR).st_mtime_ns, newest
+    except OSError:
+        return None
 
+@lru_cache(maxsize=2)
+def _load_all_entries(stamp: Tuple[int, int]) -> Dict[str, Tuple[_Entry, ...]]:
+    """filename -> parsed entries for every pack file (directory order); ``stamp`` only keys the cache."""
+    exclude = {"sources.json", ".keep"}
+    with os.scandir(DATA_DIR) as it:
+        names = [e.name for e in it if e.name.endswith(".json") and e.name not in exclude]
+    files: Dict[str, Tuple[_Entry, ...]] = {}
+    for fname in names:
+        entries = []
+        for r in _load_json_file(os.path.join(DATA_DIR, fname)):
+            if isinstance(r, dict):
+                r = dict(r)
+                r["source_file"] = fname  # keep provenance
+                entries.append(_Entry(
+                    r, _lc(r.get("crop_name")), _lc(r.get("target")), _lc(r.get("active_ingredient")),
+                    _lc(r.get("formulation")), _lc(r.get("who_class")), _lc(r.get("status")),
+                    _rank_key(r),
+                ))
+        files[fname] = tuple(entries)
+    return files
+
+@lru_cache(maxsize=32)
+def _list_category_files(category: Optional[str], bio_only: bool, chemical_only: bool, stamp: Tuple[int, int]) -> Tuple[str, ...]:
+    cand = list(_load_all_entries(stamp))
     if category:
         # keep files where the stem contains the category (simple containment)
         needle = category.lower()
-        cand = [f for f in all_files if needle in f.lower()]
-    else:
-        cand = list(all_files)
-
+        cand = [f for f in cand if needle in f.lower()]
     if bio_only:
         cand = [f for f in cand if _is_bio_file(f)]
     if chemical_only:
         cand = [f for f in cand if not _is_bio_file(f)]
-
-    files_scanned = []
-    entries: List[Dict[str, Any]] = []
-    for fname in cand:
-        path = os.path.join(DATA_DIR, fname)
-        recs = _load_json_file(path)
-        if not recs:
-            continue
-        for r in recs:
-            if isinstance(r, dict):
-                r = dict(r)
-                r["source_file"] = fname  # keep provenance
-                entries.append(r)
-        files_scanned.append(fname)
+    return tuple(cand)
+
+@lru_cache(maxsize=2)
+def _crop_index(stamp: Tuple[int, int]) -> Dict[str, Tuple[_Entry, ...]]:
+    """Lowercased crop_name -> entries across all pack files, in directory/record order."""
+    idx: Dict[str, List[_Entry]] = {}
+    for entries in _load_all_entries(stamp).values():
+        for e in entries:
+            if isinstance(e.crop, str):
+                idx.setdefault(e.crop, []).append(e)
+    return {k: tuple(v) for k, v in idx.items()}
+
+def _scan_files(category: Optional[str], bio_only: bool, chemical_only: bool,
+                crop: Optional[str] = None) -> Tuple[List[str], List[_Entry]]:
+    """Return (files_scanned, entries) from the cached pack.
+
+    With ``crop``, entries come from the crop index (restricted to the selected
+    files) instead of the union of every selected file.
+    """
+    stamp = _pack_stamp()
+    if stamp is None or not os.path.isdir(DATA_DIR):
+        return [], []
+    loaded = _load_all_entries(stamp)
+    files_scanned = [f for f in _list_category_files(category, bio_only, chemical_only, stamp) if loaded[f]]
+    if crop:
+        selected = set(files_scanned)
+        entries = [e for e in _crop_index(stamp).get(_canon(crop), ()) if e.row["source_file"] in selected]
+    else:
+        entries = [e for f in files_scanned for e in loaded[f]]
     return files_scanned, entries
 
 def _contains(hay: Optional[str], needle: Optional[str]) -> bool:
@@ -174,46 +235,53 @@ def _status_rank(s: Optional[str]) -> int:
 
 # ---------------------------- core filter + rank ----------------------------
 
-def _filter_entries(entries: List[Dict[str, Any]], flt: Dict[str, Any]) -> List[Dict[str, Any]]:
-    crop = flt.get("crop")
-    pest = flt.get("target") or flt.get("pest")
-    ai = flt.get("active_ingredient")
-    form = flt.get("formulation")
-    who = flt.get("who_class")
-    status = flt.get("status")
+def _filter_entries(entries: List[_Entry], flt: Dict[str, Any]) -> List[_Entry]:
+    # query values are canonicalized once; entries carry theirs from load time
+    def _q(v: Any) -> Optional[str]:
+        return _canon(v) if v else None
+    crop = _q(flt.get("crop"))
+    pest = _q(flt.get("target") or flt.get("pest"))
+    ai = _q(flt.get("active_ingredient"))
+    form = _q(flt.get("formulation"))
+    who = _q(flt.get("who_class"))
+    status = _q(flt.get("status"))
     reg_only = bool(flt.get("registered_only"))
 
-    out: List[Dict[str, Any]] = []
+    out: List[_Entry] = []
     for e in entries:
-        if crop and not _equals(e.get("crop_name"), crop):
+        if crop is not None and e.crop != crop:
             continue
-        if pest and not _contains(e.get("target"), pest):
+        if pest is not None and pest not in e.target:
             continue
-        if ai and not _contains(e.get("active_ingredient"), ai):
+        if ai is not None and ai not in e.ai:
             continue
-        if form and not _equals(e.get("formulation"), form):
+        if form is not None and e.form != form:
             continue
-        if who and not _equals(e.get("who_class"), who):
+        if who is not None and e.who != who:
             continue
-        if status and not _equals(e.get("status"), status):
+        if status is not None and e.status != status:
             continue
-        if reg_only and _canon(e.get("status")) != "registered":
+        if reg_only and e.status != "registered":
             continue
         out.append(e)
     return out
 
-def _rank_entries(entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    def key(e: Dict[str, Any]):
-        # 1) status (Registered first)
-        s_rank = _status_rank(e.get("status"))
-        # 2) newer as_on_date first
-        dt = _to_date_safe(e.get("as_on_date")) or _to_date_safe(e.get("last_checked"))
-        dt_key = -(dt.timestamp()) if dt else float("inf")
-        # 3) shorter PHI first (safer/earlier-to-harvest)
-        phi = _to_int_safe(e.get("phi_days"))
-        phi_key = phi if phi is not None else 9999
-        return (s_rank, dt_key, phi_key)
-    return sorted(entries, key=key)
+def _rank_key(e: Dict[str, Any]) -> Tuple[int, float, int]:
+    # 1) status (Registered first)
+    s_rank = _status_rank(e.get("status"))
+    # 2) newer as_on_date first
+    dt = _to_date_safe(e.get("as_on_date")) or _to_date_safe(e.get("last_checked"))
+    dt_key = -(dt.timestamp()) if dt else float("inf")
+    # 3) shorter PHI first (safer/earlier-to-harvest)
+    phi = _to_int_safe(e.get("phi_days"))
+    phi_key = phi if phi is not None else 9999
+    return (s_rank, dt_key, phi_key)
+
+def _entry_rank(e: _Entry) -> Tuple[int, float, int]:
+    return e.rank  # computed when the pack was loaded
+
+def _rank_entries(entries: List[_Entry]) -> List[_Entry]:
+    return sorted(entries, key=_entry_rank)
 
 # ---------------------------- public API ----------------------------
 
@@ -227,12 +295,19 @@ def pesticide_lookup(args: Dict[str, Any]) -> Dict[str, Any]:
     bio_only = bool(args.get("bio_only", False))
     chemical_only = bool(args.get("chemical_only", False))
 
-    files_scanned, all_entries = _scan_files(category, bio_only, chemical_only)
+    files_scanned, all_entries = _scan_files(category, bio_only, chemical_only, args.get("crop"))
 
     # filter
     filtered = _filter_entries(all_entries, args)
-    ranked = _rank_entries(filtered)
-    items = ranked[: max(1, limit)] if ranked else []
+    k = max(1, limit)
+    if len(filtered) <= 1:
+        top = filtered  # nothing to order
+    elif len(filtered) <= k:
+        top = _rank_entries(filtered)
+    else:
+        # top-k by rank without sorting the whole match list (same order as sorted(...)[:k])
+        top = heapq.nsmallest(k, filtered, key=_entry_rank)
+    items = [dict(e.row) for e in top]
 
     resp = {
         "data": {
@@ -21,16 +21,43 @@ Ranking: relevance score (state/district/category/issue/keywords/agency/crop/fla
 from __future__ import annotations
 
 import os
+import pickle
 import re
+import threading
+from difflib import SequenceMatcher
 from pathlib import Path
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, NamedTuple, Optional, Tuple
 
 try:
+    import numpy as np  # type: ignore
     import pandas as pd  # type: ignore
 except Exception:
+    np = None
     pd = None
 
+try:  # optional: one multi-pattern pass per row for issue/keyword/flag hits
+    import ahocorasick  # type: ignore
+except Exception:
+    ahocorasick = None  # one str.contains scan per needle
+
+try:  # optional: SIMD literal matcher; scans a whole text column in one call
+    import hyperscan  # type: ignore
+except Exception:
+    hyperscan = None  # Aho-Corasick / str.contains
+
+try:  # optional: C++ Indel similarity, an upper bound on SequenceMatcher.ratio() used for pruning
+    from rapidfuzz.distance import Indel as rf_indel  # type: ignore
+except Exception:
+    rf_indel = None  # length bound (SequenceMatcher.real_quick_ratio)
+
+try:  # optional: native xlsx parser behind pandas' engine="calamine"
+    import python_calamine  # type: ignore  # noqa: F401
+    _EXCEL_ENGINE: Optional[str] = "calamine"
+except Exception:
+    _EXCEL_ENGINE = None  # pandas default (openpyxl)
+
 try:
     from .paths import POLICY_DIR as POLICY_PATH  # type: ignore
 except Exception:
@@ -42,26 +69,35 @@ except Exception:
 
 POLICY_DIR = str(POLICY_PATH)
 
+__all__ = ["policy_match"]
+
 _WS = re.compile(r"\s+")
 
 def _canon(s: Any) -> str:
     if s is None:
         return ""
     s = str(s).strip()
+    if "  " not in s and s.isprintable():
+        return s  # printable => the only whitespace is single ASCII spaces: already canonical
     s = _WS.sub(" ", s)
     return s
 
 def _lc(s: Any) -> str:
     return _canon(s).lower()
 
+_COL_TRANS = str.maketrans("-/.", "   ")
+
 def _norm_cols(cols: List[str]) -> List[str]:
-    out = []
-    for c in cols:
-        c = _lc(c)
-        c = c.replace("-", " ").replace("/", " ").replace(".", " ")
-        c = _WS.sub("_", c).strip("_")
-        out.append(c)
-    return out
+    # lowercase, "-", "/", "." and whitespace runs -> single "_", no leading/trailing "_"
+    return ["_".join(str(c).lower().translate(_COL_TRANS).split()).strip("_") for c in cols]
+
+def _read_excel(path: str) -> Any:
+    if _EXCEL_ENGINE:
+        try:
+            return pd.read_excel(path, engine=_EXCEL_ENGINE)
+        except Exception:
+            pass  # older pandas or a workbook calamine rejects: let the default engine decide
+    return pd.read_excel(path)
 
 def _read_any(path: str) -> Optional[Any]:
     if pd is None:
@@ -71,7 +107,7 @@ def _read_any(path: str) -> Optional[Any]:
         if path.lower().endswith(".csv"):
             try:
                 # First try reading as Excel (common case of mislabeled Excel files)
-                df = pd.read_excel(path)
+                df = _read_excel(path)
                 print(f"Successfully read {path} as Excel format")
             except Exception:
                 # Fallback to CSV with different encodings
@@ -89,7 +125,7 @@ def _read_any(path: str) -> Optional[Any]:
                     return None
         elif path.lower().endswith((".xlsx", ".xls")):
             try:
-                df = pd.read_excel(path)
+                df = _read_excel(path)
                 print(f"Successfully read {path} as Excel")
             except Exception:
                 # Fallback: try CSV read if excel parser fails
@@ -112,92 +148,189 @@ def _read_any(path: str) -> Optional[Any]:
         print(f"Error reading {path}: {e}")
         return None
 
-def _load_all() -> Tuple[List[str], Optional[Any]]:
-    files, frames = [], []
-    if not os.path.isdir(POLICY_DIR):
+# column alias -> normalized key the schema expects (applied when the key is absent)
+_ALIASES = {
+    # Basic scheme info
+    "scheme_name": "scheme",
+    "slug": "scheme",
+    "details": "description",
+    "benefits": "benefit",
+    "application": "link",
+    "documents": "eligibility",
+    "level": "category",
+    "schemecategory": "category",
+    "schemeCategory": "category",
+    "tags": "tags",
+    "State": "state",
+    "policy_name": "scheme",
+    "scheme_title": "scheme",
+
+    # Agency/department
+    "implementing_agency": "agency",
+    "agency_name": "agency",
+    "department": "agency",
+
+    # Categories and types
+    "benefit_type": "category",
+    "category_type": "category",
+    "schemecategory": "category",
+
+    # Description and details
+    "details": "description",
+    "benefits": "benefit",
+    "documentsrequired": "eligibility",
+
+    # URLs
+    "url": "link",
+    "website": "link",
+    "schemeurl": "link",
+
+    # Financial fields
+    "interest": "interest_rate",
+    "int_rate": "interest_rate",
+    "max_loan_amount": "max_amount",
+    "loan_limit": "max_amount",
+
+    # Dates
+    "updated_on": "last_checked"
+}
+
+# Parsed frames per file, keyed by path -> ((mtime_ns, size), frame-or-None), and
+# the concatenated corpus keyed by the ordered signature of every file it came from.
+_CACHE_LOCK = threading.Lock()
+_FILE_CACHE: Dict[str, Tuple[Tuple[int, int], Optional[Any]]] = {}
+class _Corpus(NamedTuple):
+    files: List[str]
+    frame: Any
+    columns: Dict[str, List[Any]]  # column -> per-row Python values (what to_dict("records") held)
+    recency: Any  # float64 per row: last_checked (else as_on_date) timestamp, 0.0 if unparseable
+    locality: Dict[str, Dict[str, Any]]  # "state"/"district" -> lowercased value -> row positions
+    text: Dict[str, Any]  # matching text per row (see _match_texts), lowercased once per load
+    words: Dict[str, List[FrozenSet[str]]]  # word sets of the fuzzily matched texts
+    blobs: Dict[str, Tuple[bytes, Any]]  # "hay"/"elig" packed for hyperscan (empty without it)
+    numbers: Dict[str, Tuple[Any, Any]]  # amount/max_amount/subsidy_amount/interest_rate (see _numbers)
+
+_BIG_CACHE: Optional[Tuple[Tuple[Tuple[str, Tuple[int, int]], ...], _Corpus]] = None
+
+def _read_cached(path: str, key: Tuple[int, int]) -> Optional[Any]:
+    hit = _FILE_CACHE.get(path)
+    if hit is not None and hit[0] == key:
+        return hit[1]
+    print(f"Attempting to load: {path}")
+    df = _read_any(path)
+    if df is not None and not df.empty:
+        df["_source_file"] = os.path.basename(path)
+    _FILE_CACHE[path] = (key, df)
+    return df
+
+# Side-car snapshot of the combined frame, reused across processes while the source
+# files' (name, mtime_ns, size) signature matches; aliases/pandas version are part of the key.
+SNAPSHOT_NAME = "policy_corpus.normalized.pkl"
+
+def _snapshot_key(sig: Tuple[Tuple[str, Tuple[int, int]], ...]) -> Tuple[Any, ...]:
+    return (1, pd.__version__, sorted(_ALIASES.items()), sig)
+
+def _read_snapshot(key: Tuple[Any, ...]) -> Optional[Tuple[List[str], Any]]:
+    try:
+        with open(os.path.join(POLICY_DIR, SNAPSHOT_NAME), "rb") as f:
+            got, payload = pickle.load(f)
+    except (OSError, EOFError, ValueError, TypeError, AttributeError, ImportError, pickle.UnpicklingError):
+        return None
+    return payload if got == key else None
+
+def _write_snapshot(key: Tuple[Any, ...], payload: Tuple[List[str], Any]) -> None:
+    path = os.path.join(POLICY_DIR, SNAPSHOT_NAME)
+    tmp = f"{path}.tmp{os.getpid()}"
+    try:
+        with open(tmp, "wb") as f:
+            pickle.dump((key, payload), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)  # atomic: readers never see a partial file
+    except OSError:
+        try:
+            os.remove(tmp)  # read-only deploys just skip the snapshot
+        except OSError:
+            pass
+
+def _load_corpus() -> _Corpus:
+    """The combined corpus: from memory or the snapshot while no source file changed,
+    else re-parsing only files whose mtime/size changed."""
+    global _BIG_CACHE
+    try:
+        with os.scandir(POLICY_DIR) as it:
+            entries = [e for e in it if e.name.lower().endswith((".csv", ".xlsx", ".xls"))]
+    except OSError:
         print(f"Policy directory does not exist: {POLICY_DIR}")
-        return files, (pd.DataFrame() if pd is not None else None)
+        return _Corpus([], (pd.DataFrame() if pd is not None else None), {}, None, {}, {}, {}, {}, {})
 
-    print(f"Scanning policy directory: {POLICY_DIR}")
-    dir_files = os.listdir(POLICY_DIR)
-    print(f"Found files in directory: {dir_files}")
+    with _CACHE_LOCK:
+        sig = []
+        for e in entries:
+            try:
+                if not e.is_file():
+                    continue
+                st = e.stat()
+            except OSError:
+                continue
+            sig.append((e.name, (st.st_mtime_ns, st.st_size)))
 
-    for fn in dir_files:
-        if not fn.lower().endswith((".csv", ".xlsx", ".xls")):
-            print(f"Skipping non-data file: {fn}")
-            continue
-        path = os.path.join(POLICY_DIR, fn)
-        print(f"Attempting to load: {path}")
-        df = _read_any(path)
-        if df is None or df.empty:
-            print(f"Failed to load or empty: {fn}")
-            continue
-        df["_source_file"] = fn
-        frames.append(df)
-        files.append(fn)
-        print(f"Successfully loaded {fn} with {len(df)} rows")
+        sig_t = tuple(sig)
+        cached = _BIG_CACHE
+        if cached is not None and cached[0] == sig_t:
+            return cached[1]
+
+        key = _snapshot_key(sig_t) if pd is not None else None
+        snap = _read_snapshot(key) if key is not None else None
+        if snap is not None:
+            files, big = snap
+        else:
+            files, frames = [], []
+            for fn, st_key in sig:
+                df = _read_cached(os.path.join(POLICY_DIR, fn), st_key)
+                if df is None or df.empty:
+                    continue
+                files.append(fn)
+                frames.append(df)
+            big = _concat(frames)
+            if frames:
+                _write_snapshot(key, (files, big))
+
+        if big is None or big.empty:
+            return _Corpus(files, big, {}, None, {}, {}, {}, {}, {})
+        columns = {c: big.iloc[:, j].tolist() for j, c in enumerate(big.columns)}  # last duplicate wins
+        n = len(big)
+        locality = {}
+        for key in ("state", "district"):
+            vals = _lc_text(_raw(columns, n, key, none="None")).to_numpy()
+            locality[key] = pd.Series(np.arange(len(vals))).groupby(vals, sort=False).indices
+        text = _match_texts(columns, n)
+        words = {key: [frozenset(t.split()) for t in text[key].tolist()] for key in ("category", "agency", "crop")}
+        blobs = {key: _blob(text[key]) for key in ("hay", "elig")} if hyperscan is not None else {}
+        numbers = {c: _numbers(columns, n, c) for c in ("amount", "max_amount", "subsidy_amount", "interest_rate")}
+        corpus = _Corpus(files, big, columns, _recency(columns, n), locality, text, words, blobs, numbers)
+        _BIG_CACHE = (sig_t, corpus)
+        return corpus
+
+def _load_all() -> Tuple[List[str], Optional[Any]]:
+    corpus = _load_corpus()
+    return corpus.files, corpus.frame
 
+def _concat(frames: List[Any]) -> Optional[Any]:
     if not frames:
         print("No data frames loaded")
-        return files, (pd.DataFrame() if pd is not None else None)
+        return pd.DataFrame() if pd is not None else None
 
     if pd is not None:
         big = pd.concat(frames, ignore_index=True)
         print(f"Combined dataset has {len(big)} rows and columns: {list(big.columns)}")
     else:
         big = None
-    # unify common aliases -> normalized keys your schema expects
-    aliases = {
-        # Basic scheme info
-    "scheme_name": "scheme",
-    "slug": "scheme",
-    "details": "description",
-    "benefits": "benefit",
-    "application": "link",
-    "documents": "eligibility",
-    "level": "category",
-    "schemecategory": "category",
-    "schemeCategory": "category",
-    "tags": "tags",
-    "State": "state",
-        "policy_name": "scheme",
-        "scheme_title": "scheme",
-        
-        # Agency/department
-        "implementing_agency": "agency",
-        "agency_name": "agency",
-        "department": "agency",
-        
-        # Categories and types
-        "benefit_type": "category",
-        "category_type": "category", 
-        "schemecategory": "category",
-        
-        # Description and details
-        "details": "description",
-        "benefits": "benefit",
-        "documentsrequired": "eligibility",
-        
-        # URLs 
-        "url": "link",
-        "website": "link",
-        "schemeurl": "link",
-        
-        # Financial fields
-        "interest": "interest_rate",
-        "int_rate": "interest_rate",
-        "max_loan_amount": "max_amount",
-        "loan_limit": "max_amount",
-        
-        # Dates
-        "updated_on": "last_checked"
-    }
     if big is not None:
-        for old, new in aliases.items():
+        # unify common aliases -> normalized keys your schema expects
+        for old, new in _ALIASES.items():
             if old in big.columns and new not in big.columns:
                 big.rename(columns={old: new}, inplace=True)
 
-    return files, big
+    return big
 
 def _to_date(s: Any) -> Optional[datetime]:
     if pd is not None and isinstance(s, pd.Timestamp):
@@ -215,6 +348,28 @@ def _to_date(s: Any) -> Optional[datetime]:
             continue
     return None
 
+def _recency(cols: Dict[str, List[Any]], n: int) -> Any:
+    """Sort key per row, parsed once per corpus load (memoized per distinct value)."""
+    memo: Dict[Tuple[type, Any], Optional[datetime]] = {}
+
+    def parse(v: Any) -> Optional[datetime]:
+        try:
+            key = (type(v), v)
+            if key not in memo:
+                memo[key] = _to_date(v)
+            return memo[key]
+        except TypeError:  # unhashable cell
+            return _to_date(v)
+
+    last_checked = cols.get("last_checked") or [None] * n
+    as_on_date = cols.get("as_on_date") or [None] * n
+    out = np.zeros(n, dtype=np.float64)
+    for i in range(n):
+        dt = parse(last_checked[i]) or parse(as_on_date[i])
+        if dt:
+            out[i] = dt.timestamp()
+    return out
+
 def _float_or_none(x: Any) -> Optional[float]:
     try:
         if x is None or x == "":
@@ -223,52 +378,16 @@ def _float_or_none(x: Any) -> Optional[float]:
     except Exception:
         return None
 
+_SEP_TRANS = str.maketrans(";|", ",,")
+
 def _split_keywords(s: str) -> List[str]:
     s = _canon(s)
     if not s:
         return []
-    return [p.strip() for p in re.split(r"[;,|]+", s) if p.strip()]
-
-def _fuzzy_contains(text: str, pattern: str, threshold: float = 0.7) -> Tuple[bool, float]:
-    """Check if pattern is contained within text using fuzzy matching"""
-    text, pattern = _lc(text), _lc(pattern)
-    if not pattern or not text:
-        return False, 0.0
-        
-    # Direct containment
-    if pattern in text:
-        return True, 1.0
-        
-    # Check each word for fuzzy matches
-    text_words = text.split()
-    pattern_words = pattern.split()
-    
-    if not text_words or not pattern_words:
-        return False, 0.0
-        
-    matches = []
-    for p_word in pattern_words:
-        best_score = 0.0
-        for t_word in text_words:
-            is_match, score = _fuzzy_match(t_word, p_word, threshold=0.7)
-            if score > best_score:
-                best_score = score
-        matches.append(best_score)
-    
-    # Average match score across all pattern words
-    avg_score = sum(matches) / len(matches)
-    return avg_score >= threshold, avg_score
-
-def _contains(hay: Optional[Any], needle: Optional[str]) -> bool:
-    """Check if needle is contained in haystack with fuzzy matching"""
-    if not needle or hay is None:
-        return True
-    try:
-        is_match, _ = _fuzzy_contains(str(hay), needle)
-        return is_match
-    except Exception:
-        return False
+    # ";", "," and "|" all separate keywords (spaces don't); empty pieces from runs drop out
+    return [p.strip() for p in s.translate(_SEP_TRANS).split(",") if p.strip()]
 
+@lru_cache(maxsize=65536)
 def _get_soundex(s: str) -> str:
     """Get soundex code with modifications for Indian names/words"""
     if not s:
@@ -315,10 +434,9 @@ def _get_soundex(s: str) -> str:
     # Pad with zeros
     return (deduped + "0000")[:4]
 
+# Reference word-pair scorer: the score _FuzzyPattern reproduces for each (pattern word, text word)
 def _fuzzy_match(a: str, b: str, threshold: float = 0.8) -> Tuple[bool, float]:
     """Return (is_match, score) using multiple matching methods"""
-    from difflib import SequenceMatcher
-    
     a, b = _lc(a), _lc(b)
     if not a or not b:
         return False, 0.0
@@ -345,133 +463,298 @@ def _fuzzy_match(a: str, b: str, threshold: float = 0.8) -> Tuple[bool, float]:
     
     return score >= threshold, score
 
-def _equals(a: Any, b: str) -> bool:
-    if not b:
-        return True
-    if a is None:
-        return False
-    # Try fuzzy match with high threshold
-    is_match, _ = _fuzzy_match(str(a), b, threshold=0.9)
-    return is_match
-
-def _row_score(row: Dict[str, Any], f: Dict[str, Any]) -> Tuple[int, List[str]]:
-    score, reasons = 0, []
-
-    # Location matching with fuzzy scoring
-    if f.get("state"):
-        is_match, match_score = _fuzzy_match(str(row.get("state", "")), str(f["state"]))
-        if is_match:
-            pts = int(5 * match_score)  # Scale points by match quality
-            score += pts
-            reasons.append(f"state:{pts}")
-
-    if f.get("district"):
-        is_match, match_score = _fuzzy_match(str(row.get("district", "")), str(f["district"]))
-        if is_match:
-            pts = int(4 * match_score)
-            score += pts
-            reasons.append(f"district:{pts}")
-
-    # Category with contains (for comma-separated categories)
-    if f.get("category"):
-        is_match, match_score = _fuzzy_contains(str(row.get("category", "")), str(f["category"]))
-        if is_match:
-            pts = int(3 * match_score)
-            score += pts
-            reasons.append(f"category:{pts}")
-
-    # Agency and crop matching with fuzzy containment
-    if f.get("agency"):
-        is_match, match_score = _fuzzy_contains(str(row.get("agency", "")), str(f["agency"]))
-        if is_match:
-            pts = int(2 * match_score)
-            score += pts
-            reasons.append(f"agency:{pts}")
-
-    if f.get("crop"):
-        text_c = " ".join([
-            str(row.get("scheme", "")), 
-            str(row.get("crops", "")), 
-            str(row.get("description", "")), 
-            str(row.get("notes", "")),
-            str(row.get("tags", ""))  # Include tags for crop matching
-        ])
-        is_match, match_score = _fuzzy_contains(text_c, str(f["crop"]))
-        if is_match:
-            pts = int(2 * match_score)
-            score += pts
-            reasons.append(f"crop:{pts}")
-
-    # issue/keywords across meaningful text
-    hay = " ".join([
-        _lc(row.get("scheme", "")), 
-        _lc(row.get("description", "")), 
-        _lc(row.get("eligibility", "")),
-        _lc(row.get("benefit", "")), 
-        _lc(row.get("category", "")), 
-        _lc(row.get("notes", "")),
-        _lc(row.get("tags", ""))  # Include tags in search
-    ])
+_SCORED_FILTERS = ("state","district","category","agency","issue","keywords","query","crop",
+                   "smallholder","women","sc_st","fpo","tenant","kcc","min_amount","max_interest")
+
+def _raw(cols: Dict[str, List[Any]], n: int, col: str, none: str = "") -> Any:
+    """Column as strings: missing column -> "", ``None`` cells -> ``none``, else ``str(v)``."""
+    vals = cols.get(col)
+    if vals is None:
+        return pd.Series([""] * n, dtype=object)
+    return pd.Series([none if v is None else str(v) for v in vals], dtype=object)
+
+def _lc_text(s: Any) -> Any:
+    """Vectorized ``_lc`` over a string column."""
+    return s.str.strip().str.replace(_WS.pattern, " ", regex=True).str.lower()
+
+def _ratio_bound(a: str, b: str) -> float:
+    """Upper bound on ``SequenceMatcher(None, a, b).ratio()``."""
+    if rf_indel is not None:
+        return rf_indel.normalized_similarity(a, b) + 1e-9  # LCS-based, >= matching blocks
+    return 2.0 * min(len(a), len(b)) / (len(a) + len(b))
+
+class _FuzzyPattern:
+    """Fuzzy containment of one pattern in many texts, for texts that don't contain it outright.
+
+    A text's score is the average over pattern words of the best ``_fuzzy_match`` score
+    against its words; it matches at 0.7. Per pattern word that best score is
+    max(0.6 * best ratio, 0.4 if any soundex agrees, 0.3 if any containment), or 1.0
+    on an exact word. Ratios are memoized across texts and only computed for words
+    whose upper bound can still raise that maximum, so scores equal the pairwise loop.
+    """
+
+    def __init__(self, pattern: str):
+        self.words = pattern.split()
+        self._codes = [_get_soundex(w) for w in self.words]
+        self._ratios: List[Dict[str, float]] = [{} for _ in self.words]
+
+    def _best(self, j: int, words: Any) -> float:
+        p, code, memo = self.words[j], self._codes[j], self._ratios[j]
+        cheap = 0.0
+        if any(_get_soundex(t) == code for t in words):
+            cheap = 0.4
+        elif any(t in p or p in t for t in words):
+            cheap = 0.3
+        best = 0.0
+        for ub, t in sorted(((_ratio_bound(t, p), t) for t in words), reverse=True):
+            if ub * 0.6 <= cheap or ub <= best:
+                break
+            r = memo.get(t)
+            if r is None:
+                r = memo[t] = SequenceMatcher(None, t, p).ratio()
+            if r > best:
+                best = r
+        return max(best * 0.6, cheap)
+
+    def ceiling(self, words: FrozenSet[str]) -> float:
+        """Upper bound on the average: exact words score 1.0, any other word at most 0.6."""
+        m = len(self.words)
+        exact = sum(1 for p in self.words if p in words)
+        return (exact + 0.6 * (m - exact)) / m
+
+    def cap(self, words: FrozenSet[str], weight: int) -> int:
+        """Most points ``int(weight * score)`` the fallback can award for this word set."""
+        top = self.ceiling(words)
+        return int(weight * top + 1e-9) if top >= 0.7 - 1e-9 else 0
+
+    def score(self, words: FrozenSet[str]) -> Optional[float]:
+        """Average word score over a text's word set when it reaches the 0.7 threshold, else None."""
+        if self.ceiling(words) < 0.7 - 1e-9:
+            return None  # the threshold is out of reach
+        matches = [1.0 if p in words else self._best(j, words) for j, p in enumerate(self.words)]
+        avg_score = sum(matches) / len(matches)
+        return avg_score if avg_score >= 0.7 else None
+
+@lru_cache(maxsize=256)
+def _fuzzy_pattern(pattern: str) -> _FuzzyPattern:
+    """Scorer specialized to one filter value; cached so a repeated value reuses its
+    soundex codes and ratio memo (both depend on word pairs only, not on the corpus)."""
+    return _FuzzyPattern(pattern)
+
+def _contained_points(text: Any, pattern: str, weight: int) -> Tuple[Any, Any]:
+    """(points, pending): ``weight`` where the text contains ``pattern`` outright, plus the
+    rows left for the ``_FuzzyPattern`` fallback."""
+    pts = np.zeros(len(text), dtype=np.int32)
+    if not pattern:
+        return pts, np.zeros(0, dtype=np.intp)
+    contained = text.str.contains(pattern, regex=False).to_numpy(dtype=bool)
+    pts[contained] = weight
+    return pts, np.flatnonzero(~contained)
+
+def _blob(text: Any) -> Tuple[bytes, Any]:
+    """Rows' UTF-8 joined by newlines (canonical text never contains one), and each row's end offset."""
+    parts = [t.encode("utf-8", "surrogatepass") for t in text.tolist()]
+    return b"\n".join(parts), np.cumsum([len(b) + 1 for b in parts]) - 1
+
+def _hits(text: Any, needles: List[str], blob: Optional[Tuple[bytes, Any]] = None) -> Dict[str, Any]:
+    """{needle: bool array of rows whose text contains it}."""
+    uniq = list(dict.fromkeys(needles))
+    if hyperscan is not None and blob is not None:
+        # one literal multi-pattern scan over the whole column; UTF-8 keeps substring semantics
+        data, ends = blob
+        db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+        db.compile(expressions=[nd.encode("utf-8", "surrogatepass") for nd in uniq],
+                   ids=list(range(len(uniq))), elements=len(uniq), flags=[0] * len(uniq), literal=True)
+        ids: List[int] = []
+        tos: List[int] = []
+
+        def on_match(j: int, _start: int, to: int, _flags: int, _ctx: Any) -> None:
+            ids.append(j)
+            tos.append(to)
+
+        db.scan(data, match_event_handler=on_match)
+        found = np.zeros((len(text), len(uniq)), dtype=bool)
+        found[np.searchsorted(ends, tos), ids] = True
+        return {nd: found[:, j] for j, nd in enumerate(uniq)}
+    if ahocorasick is None or len(uniq) < 2:
+        return {nd: text.str.contains(nd, regex=False).to_numpy(dtype=bool) for nd in uniq}
+    auto = ahocorasick.Automaton()
+    for j, nd in enumerate(uniq):
+        auto.add_word(nd, j)
+    auto.make_automaton()
+    found = np.zeros((len(text), len(uniq)), dtype=bool)
+    for i, s in enumerate(text.to_numpy()):
+        for _, j in auto.iter(s):
+            found[i, j] = True
+    return {nd: found[:, j] for j, nd in enumerate(uniq)}
+
+def _match_texts(cols: Dict[str, List[Any]], n: int) -> Dict[str, Any]:
+    """Lowercased text columns as the scorer reads them:
+    category/agency: ``str(value)``; crop: scheme+crops+description+notes+tags joined raw;
+    hay: scheme/description/eligibility/benefit/category/notes/tags each ``_lc``'d, then joined;
+    elig: eligibility + notes."""
+    def lc_join(names: Tuple[str, ...]) -> Any:
+        out = _lc_text(_raw(cols, n, names[0]))
+        for c in names[1:]:
+            out = out + " " + _lc_text(_raw(cols, n, c))
+        return out
+
+    crop = _raw(cols, n, "scheme", none="None")
+    for c in ("crops", "description", "notes", "tags"):
+        crop = crop + " " + _raw(cols, n, c, none="None")
+    return {
+        "category": _lc_text(_raw(cols, n, "category", none="None")),
+        "agency": _lc_text(_raw(cols, n, "agency", none="None")),
+        "crop": _lc_text(crop),
+        "hay": lc_join(("scheme", "description", "eligibility", "benefit", "category", "notes", "tags")),
+        "elig": lc_join(("eligibility", "notes")),
+    }
+
+def _numbers(cols: Dict[str, List[Any]], n: int, col: str) -> Tuple[Any, Any]:
+    """``_float_or_none`` per row as (float64 values, present mask); ``None`` -> (nan, False).
+    A parsed NaN stays present, as it did for the ``or`` chain. Parsed once per distinct value."""
+    vals = cols.get(col)
+    if vals is None:
+        return np.full(n, np.nan), np.zeros(n, dtype=bool)
+    memo: Dict[Tuple[type, Any], Optional[float]] = {}
+    out = np.full(n, np.nan)
+    present = np.zeros(n, dtype=bool)
+    for i, v in enumerate(vals):
+        try:
+            key = (type(v), v)  # 0 == False, but only one of them parses
+            x = memo[key] if key in memo else memo.setdefault(key, _float_or_none(v))
+        except TypeError:  # unhashable cell
+            x = _float_or_none(v)
+        if x is not None:
+            out[i] = x
+            present[i] = True
+    return out, present
+
+def _score_frame(corpus: _Corpus, f: Dict[str, Any], k: int) -> Tuple[Any, List[str], Any]:
+    """Score every row at once; returns (total, term names, terms x rows points matrix),
+    terms in reason order. Exact for every row that can make the top ``k``.
+
+    Text filters in ``f`` arrive canonical and lowercased, keywords pre-split as ``_kws_lc``.
+    """
+    n = len(corpus.frame)
+    terms: List[Tuple[str, Any]] = []
+
+    # Location: the fuzzy scorer only reaches the 0.8 threshold on exact (canonical) equality,
+    # so points go straight to the rows indexed under the wanted value
+    for key, weight in (("state", 5), ("district", 4)):
+        if f.get(key):
+            pts = np.zeros(n, dtype=np.int32)
+            want = f[key]
+            if want:
+                pts[corpus.locality[key].get(want, [])] = weight
+            terms.append((key, pts))
+
+    # Category (comma-separated values), agency and crop via fuzzy containment;
+    # the fuzzy fallback for rows without a plain hit is deferred until the cheap terms are in
+    fuzzy: List[Tuple[str, _FuzzyPattern, int, Any, Any]] = []
+    for key, weight in (("category", 3), ("agency", 2), ("crop", 2)):
+        if f.get(key):
+            pattern = f[key]
+            pts, pending = _contained_points(corpus.text[key], pattern, weight)
+            terms.append((key, pts))
+            fz, words = _fuzzy_pattern(pattern), corpus.words[key]
+            caps = np.array([fz.cap(words[i], weight) for i in pending], dtype=np.int32)
+            if caps.any():
+                fuzzy.append((key, fz, weight, pending[caps > 0], caps[caps > 0]))
 
     issue = f.get("issue") or ""
-    if issue:
-        # issue is strong signal
-        if issue.lower() in hay:
-            score += 3; reasons.append("issue")
-
-    kws = _split_keywords(f.get("keywords") or f.get("query") or "")
-    if kws:
-        hits = sum(1 for kw in kws if kw.lower() in hay)
-        if hits:
-            score += 2 * hits; reasons.append(f"keywords:{hits}")
-
-    # flags nudged via eligibility text
+    kws = f.get("_kws_lc") or []
+    if issue or kws:
+        hit = _hits(corpus.text["hay"], ([issue] if issue else []) + kws, corpus.blobs.get("hay"))
+        if issue:
+            terms.append(("issue", 3 * hit[issue].astype(np.int32)))
+        if kws:
+            terms.append(("keywords", 2 * sum(hit[kw].astype(np.int32) for kw in kws)))
+
     flags = [k for k in ("smallholder","women","sc_st","fpo","tenant","kcc") if f.get(k)]
     if flags:
-        elig = _lc(row.get("eligibility")) + " " + _lc(row.get("notes"))
-        fhits = sum(1 for fl in flags if fl.replace("_"," ") in elig)
-        if fhits:
-            score += fhits; reasons.append(f"flags:{fhits}")
+        hit = _hits(corpus.text["elig"], [fl.replace("_", " ") for fl in flags], corpus.blobs.get("elig"))
+        terms.append(("flags", sum(hit[fl.replace("_", " ")].astype(np.int32) for fl in flags)))
 
-    # numeric constraints
     mi = f.get("min_amount")
     if mi is not None:
-        got = None
-        for fld in ("amount","max_amount","subsidy_amount"):
-            got = got or _float_or_none(row.get(fld))
-        if got is not None and got >= float(mi):
-            score += 1; reasons.append("amount>=min")
+        # first truthy of amount / max_amount / subsidy_amount (0 and missing fall through)
+        got, has = corpus.numbers["amount"]
+        for fld in ("max_amount", "subsidy_amount"):
+            val, pres = corpus.numbers[fld]
+            keep = has & (got != 0)
+            got, has = np.where(keep, got, val), np.where(keep, has, pres)
+        ok = has & (got >= float(mi)) if has.any() else has
+        terms.append(("amount>=min", ok.astype(np.int32)))
 
     mx = f.get("max_interest")
     if mx is not None:
-        ir = _float_or_none(row.get("interest_rate"))
-        if ir is not None and ir <= float(mx):
-            score += 1; reasons.append("interest<=max")
+        ir, has = corpus.numbers["interest_rate"]
+        ok = has & (ir <= float(mx)) if has.any() else has
+        terms.append(("interest<=max", ok.astype(np.int32)))
+
+    if fuzzy:
+        # Branch and bound: each pending row's fallback is capped by its exact-word ceiling, so
+        # rows whose capped total stays below the k-th best score so far cannot reach the top k
+        # and skip the fallback.
+        lower = sum(p for _, p in terms)
+        upper = lower.copy()
+        for _, _, _, pending, caps in fuzzy:
+            upper[pending] += caps
+        kth = np.partition(lower, n - k)[n - k] if n > k else None
+        by_name = dict(terms)
+        for key, fz, weight, pending, _ in fuzzy:
+            if kth is not None:
+                pending = pending[upper[pending] >= kth]
+            pts, words = by_name[key], corpus.words[key]
+            for i in pending:
+                match_score = fz.score(words[i])
+                if match_score is not None:
+                    pts[i] = int(weight * match_score)
+
+    names = [name for name, _ in terms]
+    pts = np.vstack([p for _, p in terms]).astype(np.int32) if terms else np.zeros((0, n), dtype=np.int32)
+    return pts.sum(axis=0, dtype=np.int32), names, pts
+
+def _reasons(names: List[str], pts: Any, i: int) -> List[str]:
+    out = []
+    for name, p in zip(names, pts[:, i].tolist()):
+        if p <= 0:
+            continue
+        if name in ("issue", "amount>=min", "interest<=max"):
+            out.append(name)
+        elif name == "keywords":
+            out.append(f"keywords:{p // 2}")
+        else:
+            out.append(f"{name}:{p}")
+    return out
 
-    return score, reasons
+def _select_record(cols: Dict[str, List[Any]], idx: int) -> Dict[str, Any]:
+    def get(key: str) -> Any:
+        col = cols.get(key)
+        return None if col is None else col[idx]
 
-def _select_record(row: Dict[str, Any], idx: int) -> Dict[str, Any]:
     # map to schema keys + keep provenance
     keep = {
-        "scheme": row.get("scheme"),
-        "category": row.get("category"),
-        "agency": row.get("agency"),
-        "state": row.get("state"),
-        "district": row.get("district"),
-        "description": row.get("description"),
-        "eligibility": row.get("eligibility"),
-        "benefit": row.get("benefit"),
-        "amount": row.get("amount"),
-        "max_amount": row.get("max_amount"),
-        "interest_rate": row.get("interest_rate"),
-        "crops": row.get("crops"),
-        "link": row.get("link"),
-        "status": row.get("status"),
-        "as_on_date": row.get("as_on_date"),
-        "last_checked": row.get("last_checked"),
-        "sources": row.get("sources"),
-        "source_file": row.get("_source_file"),
-        "record_id": row.get("id") or row.get("record_id") or idx,
+        "scheme": get("scheme"),
+        "category": get("category"),
+        "agency": get("agency"),
+        "state": get("state"),
+        "district": get("district"),
+        "description": get("description"),
+        "eligibility": get("eligibility"),
+        "benefit": get("benefit"),
+        "amount": get("amount"),
+        "max_amount": get("max_amount"),
+        "interest_rate": get("interest_rate"),
+        "crops": get("crops"),
+        "link": get("link"),
+        "status": get("status"),
+        "as_on_date": get("as_on_date"),
+        "last_checked": get("last_checked"),
+        "sources": get("sources"),
+        "source_file": get("_source_file"),
+        "record_id": get("id") or get("record_id") or idx,
     }
     # strip empty
     return {k: v for k, v in keep.items() if v not in (None, "", [])}
@@ -482,7 +765,8 @@ def policy_match(args: Dict[str, Any]) -> Dict[str, Any]:
                 "error": "pandas_not_available",
                 "source_stamp": {"type": "static_pack", "path": POLICY_DIR}}
 
-    files, df = _load_all()
+    corpus = _load_corpus()
+    files, df, recency = corpus.files, corpus.frame, corpus.recency
     if df is None or df.empty:
         return {"data": {"items": [], "count": 0},
                 "error": "no_policy_files",
@@ -496,30 +780,35 @@ def policy_match(args: Dict[str, Any]) -> Dict[str, Any]:
         if k in f and f[k] is not None:
             f[k] = _canon(f[k])
 
-    # compute score per row
-    records = df.to_dict(orient="records")
-    scored: List[Tuple[int, List[str], Dict[str, Any], int]] = []
-    for i, r in enumerate(records):
-        s, reasons = _row_score(r, f)
-        # if any filters present, drop zero-score rows to keep precision
-        if any(f.get(k) for k in ("state","district","category","agency","issue","keywords","query","crop",
-                                  "smallholder","women","sc_st","fpo","tenant","kcc","min_amount","max_interest")):
-            if s <= 0:
-                continue
-        scored.append((s, reasons, r, i))
-
-    # sort: score desc, then recency (last_checked/as_on_date) desc
-    def dt_key(rec: Dict[str, Any]) -> float:
-        dt = _to_date(rec.get("last_checked")) or _to_date(rec.get("as_on_date"))
-        return dt.timestamp() if dt else 0.0
+    # lowercase once for matching; `f` keeps the canonical values echoed back below
+    q = dict(f)
+    for k in ("state","district","category","agency","crop","issue"):
+        if isinstance(q.get(k), str):
+            q[k] = q[k].lower()
+    q["_kws_lc"] = [kw.lower() for kw in _split_keywords(f.get("keywords") or f.get("query") or "")]
 
-    scored.sort(key=lambda t: (t[0], dt_key(t[2])), reverse=True)
+    # compute score per row
+    k = max(1, limit)
+    score, names, pts = _score_frame(corpus, q, k)
+    idx = np.arange(len(df))
+    # if any filters present, drop zero-score rows to keep precision
+    if any(f.get(k) for k in _SCORED_FILTERS):
+        idx = idx[score[idx] > 0]
+
+    # only the top `limit` are returned: keep rows scoring at least the k-th best score
+    # (ties included, so the cut stays exact) before ordering
+    if len(idx) > k:
+        s = score[idx]
+        idx = idx[s >= np.partition(s, len(s) - k)[len(s) - k]]
+
+    # sort: score desc, then recency (last_checked/as_on_date) desc; stable, so ties keep file order
+    order = idx[np.lexsort((-recency[idx], -score[idx]))][:k].tolist()
 
     items: List[Dict[str, Any]] = []
-    for s, reasons, row, idx in scored[: max(1, limit)]:
-        entry = _select_record(row, idx)
-        entry["match_score"] = s
-        entry["match_reasons"] = reasons
+    for i in order:
+        entry = _select_record(corpus.columns, i)
+        entry["match_score"] = int(score[i])
+        entry["match_reasons"] = _reasons(names, pts, i)
         items.append(entry)
 
     resp = {
@@ -552,3 +841,17 @@ def policy_match(args: Dict[str, Any]) -> Dict[str, Any]:
     if not items:
         resp["error"] = "no_matches"
     return resp
+
+
+if __name__ == "__main__":
+    demo_args = {
+        "state": "Maharashtra",
+        "keywords": "irrigation, drip",
+        "crop": "sugarcane",
+        "limit": 5,
+    }
+    out = policy_match(demo_args)
+    print("Source:", out.get("source_stamp"))
+    print("Matches:", out["data"]["count"], out.get("error", ""))
+    for i, r in enumerate(out["data"]["items"], 1):
+        print(f"{i}. [{r.get('match_score')}] {r.get('scheme')} | {r.get('state')} | {', '.join(r.get('match_reasons', []))}")
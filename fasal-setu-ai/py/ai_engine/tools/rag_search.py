@@ -6,7 +6,8 @@ One-file RAG tool for LLM-1 planner service.
 Capabilities
 - Load .txt and .json from a data folder
 - Chunk via LangChain RecursiveCharacterTextSplitter
-- Embed with Pinecone hosted embeddings (e.g., llama-text-embed-v2)
+- Embed with Pinecone hosted embeddings (e.g., llama-text-embed-v2), or a self-hosted
+  OpenAI-compatible embedding server (Infinity / ONNX Runtime) via EMBED_SERVER_URL
 - Upsert/query Pinecone v7+ (serverless)
 - Search API returning [{text, source_stamp, score, id}, ...]
 - Optional MMR reranker
@@ -21,11 +22,27 @@ Env (.env at repo root or any parent):
   PINECONE_INDEX=rag-llm1
   PINECONE_NAMESPACE=default
   EMBED_MODEL=llama-text-embed-v2
+  # Optional: self-hosted embedding server exposing POST /embeddings (e.g. michaelfeil/infinity)
+  EMBED_SERVER_URL=http://localhost:7997
+  EMBED_DIM=1024                  # optional; skips the first-use dimension probe (known hosted models never probe)
   DATA_DIR=/absolute/or/relative/path/to/data
   CHUNK_SIZE=1000
   CHUNK_OVERLAP=120
   TOP_K=5
   BATCH_SIZE=64
+  EMBED_BATCH=96                  # default 256 when EMBED_SERVER_URL is set
+  UPSERT_PARALLEL=4
+  LOAD_WORKERS=8
+  EMBED_CACHE=<DATA_DIR>/.embed_cache/embeddings.sqlite3   # set empty to disable
+  EMBED_CACHE_DTYPE=float32       # int8: scalar-quantized cache rows (~4x smaller)
+  STREAM_JSON_BYTES=8388608       # stream top-level JSON arrays at/above this size (needs ijson)
+  EMBED_PRECISION=fp32            # fp16: send half-precision values (shorter upsert payloads)
+  EMBED_QUERY_BATCH=32            # concurrent search queries coalesced per embed request; 1 disables
+  EMBED_QUERY_WAIT_MS=0           # extra time to wait for more queries before sending a batch
+  EMBED_QUERY_TIMEOUT=90          # seconds a search waits for its batched query embedding
+  QUERY_CACHE_TTL_HOURS=6         # reuse search results for a repeated query; 0 disables
+  QUERY_CACHE_SIZE=256
+  QUERY_CACHE_SIM=0               # e.g. 0.95: also reuse results of a near-identical query vector
 """
 
 from __future__ import annotations
@@ -36,8 +53,16 @@ import time
 import argparse
 import pathlib
 import hashlib
+import queue
+import sqlite3
+import threading
+from array import array
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from typing import Any, Dict, Iterable, List, Optional, Tuple, Union, cast
 
+import requests
 from dotenv import load_dotenv
 from pinecone import Pinecone, ServerlessSpec
 from langchain_text_splitters import RecursiveCharacterTextSplitter
@@ -51,6 +76,18 @@ except Exception:
     except Exception:
         Tool = None  # still usable without Tool
 
+# Optional: faster JSON parsing for corpus loading
+try:
+    import orjson
+except Exception:
+    orjson = None  # stdlib json fallback
+
+# Optional: incremental parsing of large top-level JSON arrays
+try:
+    import ijson
+except Exception:
+    ijson = None  # whole-file parse only
+
 # Optional: reranker needs numpy
 try:
     import numpy as np
@@ -80,11 +117,36 @@ PINECONE_REGION  = os.getenv("PINECONE_REGION", PINECONE_ENV or "")
 PINECONE_INDEX   = os.getenv("PINECONE_INDEX", "rag-llm1")
 PINECONE_NS      = os.getenv("PINECONE_NAMESPACE", "default")
 EMBED_MODEL      = os.getenv("EMBED_MODEL", "llama-text-embed-v2")
+EMBED_SERVER_URL = os.getenv("EMBED_SERVER_URL", "").rstrip("/")
 
 DEFAULT_CHUNK_SIZE    = int(os.getenv("CHUNK_SIZE", "1000"))
 DEFAULT_CHUNK_OVERLAP = int(os.getenv("CHUNK_OVERLAP", "120"))
 DEFAULT_TOP_K         = int(os.getenv("TOP_K", "5"))
 BATCH_SIZE            = int(os.getenv("BATCH_SIZE", "64"))
+# Max inputs per embedding request: llama-text-embed-v2 (hosted) accepts up to 96;
+# a self-hosted GPU server is saturated by much larger batches
+EMBED_BATCH           = int(os.getenv("EMBED_BATCH", "256" if EMBED_SERVER_URL else "96"))
+# Upsert requests kept in flight (async_req) while the next batch is embedded
+UPSERT_PARALLEL       = int(os.getenv("UPSERT_PARALLEL", "4"))
+# Precision of upserted vector values: fp32 (default) or fp16 (~halves JSON payload)
+EMBED_PRECISION       = os.getenv("EMBED_PRECISION", "fp32").lower()
+# Threads reading + flattening corpus JSON files in load_corpus
+LOAD_WORKERS          = int(os.getenv("LOAD_WORKERS", "8"))
+# Sidecar store of (model, text) -> embedding so re-ingestion only embeds new chunks
+EMBED_CACHE           = os.getenv("EMBED_CACHE", str(DATA_DIR / ".embed_cache" / "embeddings.sqlite3"))
+# Storage format of cached vectors: float32 (exact) or int8 (per-vector scale, ~4x smaller)
+EMBED_CACHE_DTYPE     = os.getenv("EMBED_CACHE_DTYPE", "float32").lower()
+# Files at least this large that hold a top-level array are parsed item by item
+STREAM_JSON_BYTES     = int(os.getenv("STREAM_JSON_BYTES", str(8 * 1024 * 1024)))
+# Search queries arriving while an embed request is in flight are sent together in the next one
+EMBED_QUERY_BATCH     = max(1, min(int(os.getenv("EMBED_QUERY_BATCH", "32")), EMBED_BATCH))
+EMBED_QUERY_WAIT_MS   = float(os.getenv("EMBED_QUERY_WAIT_MS", "0"))
+EMBED_QUERY_TIMEOUT   = float(os.getenv("EMBED_QUERY_TIMEOUT", "90"))
+# In-process cache of search results per (query, options); cleared on upsert/wipe
+QUERY_CACHE_TTL_HOURS = float(os.getenv("QUERY_CACHE_TTL_HOURS", "6"))
+QUERY_CACHE_SIZE      = int(os.getenv("QUERY_CACHE_SIZE", "256"))
+# Cosine similarity at which a cached query vector's results are reused (0 = exact text only)
+QUERY_CACHE_SIM       = float(os.getenv("QUERY_CACHE_SIM", "0"))
 
 # --------------------------------------------------------------------------------------
 # Pinecone client + Hosted Embeddings
@@ -124,50 +186,184 @@ def _as_vectors(embed_out) -> List[List[float]]:
             raise TypeError(f"Unexpected embedding row type: {type(row)}")
     return vectors
 
+# Keep-alive session for the embedding server; the first-use dimension probe warms it
+_EMBED_SESSION = requests.Session()
+
+def _embed_server(texts: List[str]) -> List[List[float]]:
+    """Embed via a self-hosted OpenAI-compatible /embeddings endpoint (Infinity, ORT server)."""
+    r = _EMBED_SESSION.post(f"{EMBED_SERVER_URL}/embeddings",
+                      json={"model": EMBED_MODEL, "input": texts}, timeout=60)
+    r.raise_for_status()
+    rows = sorted(r.json()["data"], key=lambda d: d.get("index", 0))
+    return [row["embedding"] for row in rows]
+
 def embed_texts(texts: List[str]) -> List[List[float]]:
     if not texts:
         return []
+    _connect()
     if pc is None or _RAG_DISABLED_REASON:
         # return zero-vectors (length 0) to keep downstream logic simple
         return [[0.0] * (EMBED_DIM or 1) for _ in texts]
-    out = pc.inference.embed(
-        model=EMBED_MODEL,
-        inputs=texts,
-        parameters={"input_type": "passage", "truncate": "END"},
-    )
-    return _as_vectors(out)
+    # One request per EMBED_BATCH window so callers can pass a whole upsert batch
+    vectors: List[List[float]] = []
+    for i in range(0, len(texts), EMBED_BATCH):
+        window = texts[i:i + EMBED_BATCH]
+        if EMBED_SERVER_URL:
+            vectors.extend(_embed_server(window))
+            continue
+        out = pc.inference.embed(
+            model=EMBED_MODEL,
+            inputs=window,
+            parameters={"input_type": "passage", "truncate": "END"},
+        )
+        vectors.extend(_as_vectors(out))
+    return vectors
 
-# Probe dimension
-if pc is not None and _RAG_DISABLED_REASON is None:
-    try:
-        _probe_vec = embed_texts(["__probe__"])[0]
-        EMBED_DIM = len(_probe_vec)
-    except Exception as e:
-        _RAG_DISABLED_REASON = f"embed_probe_failed:{e.__class__.__name__}"
-        pc = None  # disable
-else:
-    EMBED_DIM = 0
-
-# Ensure index exists
-if pc is not None and _RAG_DISABLED_REASON is None:
-    def _ensure_index() -> None:  # type: ignore[func-returns-value]
-        existing = {ix["name"] for ix in pc.list_indexes()}  # type: ignore[union-attr]
-        if PINECONE_INDEX not in existing:
-            print(f"[rag_search] Creating index '{PINECONE_INDEX}' (dim={EMBED_DIM}, cosine) on {PINECONE_CLOUD}/{PINECONE_REGION} ...")
-            pc.create_index(  # type: ignore[union-attr]
-                name=PINECONE_INDEX,
-                dimension=EMBED_DIM,
-                metric="cosine",
-                spec=ServerlessSpec(cloud=PINECONE_CLOUD, region=PINECONE_REGION),
-            )
-    try:
-        _ensure_index()
-        index = pc.Index(PINECONE_INDEX)  # type: ignore[union-attr]
-    except Exception as e:
-        _RAG_DISABLED_REASON = f"index_init_failed:{e.__class__.__name__}"
-        pc = None  # disable
-else:
-    index = None  # type: ignore
+def encode_batch(texts: List[str]):
+    """embed_texts() as a float32 ndarray of shape (N, EMBED_DIM); requires numpy."""
+    if np is None:
+        raise RuntimeError("encode_batch requires numpy")
+    _connect()
+    if not texts:
+        return np.zeros((0, EMBED_DIM or 1), dtype=np.float32)
+    return np.asarray(embed_texts(texts), dtype=np.float32)
+
+def _norm_query(text: str) -> str:
+    return " ".join(text.split())
+
+def embed_query(text: str) -> List[float]:
+    """Single-text embed for search: one request, no batching loop or window slicing.
+
+    Memoized per whitespace-normalized text; the returned list is shared, do not mutate it.
+    """
+    return _embed_query_cached(_norm_query(text))
+
+@lru_cache(maxsize=1024)
+def _embed_query_cached(text: str) -> List[float]:
+    _connect()
+    if pc is None or _RAG_DISABLED_REASON:
+        return [0.0] * (EMBED_DIM or 1)
+    if EMBED_QUERY_BATCH <= 1:
+        return _embed_queries([text])[0]
+    return _query_batcher.submit(text).result(timeout=EMBED_QUERY_TIMEOUT)
+
+def _embed_queries(texts: List[str]) -> List[List[float]]:
+    """One embed request for up to EMBED_QUERY_BATCH search queries."""
+    if EMBED_SERVER_URL:
+        vectors = _embed_server(texts)
+    else:
+        out = pc.inference.embed(model=EMBED_MODEL, inputs=texts,  # type: ignore[union-attr]
+                                 parameters={"input_type": "passage", "truncate": "END"})
+        vectors = _as_vectors(out)
+    if len(vectors) != len(texts):
+        raise ValueError(f"embedder returned {len(vectors)} vectors for {len(texts)} queries")
+    return vectors
+
+class _QueryBatcher:
+    """Dynamic batching for search queries: a single worker thread sends whatever queries
+    are queued (up to ``max_batch``) as one embed request. A lone query goes out at once;
+    queries that arrive while a request is in flight share the next one.
+    """
+
+    def __init__(self, max_batch: int, max_wait_ms: float):
+        self.max_batch = max_batch
+        self.max_wait = max(0.0, max_wait_ms) / 1000.0
+        self._queue: "queue.SimpleQueue[Tuple[str, Future]]" = queue.SimpleQueue()
+        self._worker: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def submit(self, text: str) -> "Future[List[float]]":
+        fut: "Future[List[float]]" = Future()
+        self._queue.put((text, fut))
+        if self._worker is None or not self._worker.is_alive():
+            with self._lock:
+                if self._worker is None or not self._worker.is_alive():
+                    self._worker = threading.Thread(target=self._run, name="rag-embed-batcher", daemon=True)
+                    self._worker.start()
+        return fut
+
+    def _collect(self) -> List[Tuple[str, Future]]:
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch:
+            wait = deadline - time.monotonic()
+            try:
+                batch.append(self._queue.get(timeout=wait) if wait > 0 else self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._collect()
+            # every future in the batch gets a result or an exception, whatever goes wrong
+            try:
+                texts = list(dict.fromkeys(t for t, _ in batch))
+                vecs = dict(zip(texts, _embed_queries(texts)))
+                for t, fut in batch:
+                    fut.set_result(vecs[t])
+            except Exception as e:
+                for _, fut in batch:
+                    if not fut.done():
+                        fut.set_exception(e)
+
+_query_batcher = _QueryBatcher(EMBED_QUERY_BATCH, EMBED_QUERY_WAIT_MS)
+
+# Output width of Pinecone-hosted models; these need no probe embed to size the index
+_HOSTED_EMBED_DIMS = {"llama-text-embed-v2": 1024, "multilingual-e5-large": 1024}
+
+# Dimension probe + index handle are resolved on first use, not at import, so importing
+# the tool (e.g. when the planner builds its TOOL_MAP) costs no network round-trips.
+# A self-hosted server may serve anything under EMBED_MODEL, so it is probed unless EMBED_DIM is set.
+EMBED_DIM = int(os.getenv("EMBED_DIM", "0")) or (0 if EMBED_SERVER_URL else _HOSTED_EMBED_DIMS.get(EMBED_MODEL, 0))
+index = None  # type: ignore
+_connected = False
+_connect_done = False  # set once pc/index are final; searches then skip the lock
+_connect_lock = threading.RLock()
+
+def _connect() -> None:
+    """Probe the embedding dimension (if unknown) and open (or create) the index once per process.
+
+    The client and index handle are module globals reused by every call; after the first
+    call this is a single flag check.
+    """
+    global pc, index, EMBED_DIM, _RAG_DISABLED_REASON, _connected, _connect_done
+    if _connect_done:
+        return
+    with _connect_lock:  # RLock: the probe re-enters via embed_texts
+        if _connected:
+            return
+        _connected = True  # set first: the probe below goes through embed_texts
+        try:
+            if pc is None or _RAG_DISABLED_REASON:
+                return
+            if not EMBED_DIM:
+                try:
+                    EMBED_DIM = len(embed_texts(["__probe__"])[0])
+                except Exception as e:
+                    _RAG_DISABLED_REASON = f"embed_probe_failed:{e.__class__.__name__}"
+                    pc = None  # disable
+                    return
+            try:
+                existing = {ix["name"] for ix in pc.list_indexes()}  # type: ignore[union-attr]
+                if PINECONE_INDEX not in existing:
+                    print(f"[rag_search] Creating index '{PINECONE_INDEX}' (dim={EMBED_DIM}, cosine) on {PINECONE_CLOUD}/{PINECONE_REGION} ...")
+                    pc.create_index(  # type: ignore[union-attr]
+                        name=PINECONE_INDEX,
+                        dimension=EMBED_DIM,
+                        metric="cosine",
+                        spec=ServerlessSpec(cloud=PINECONE_CLOUD, region=PINECONE_REGION),
+                    )
+                index = pc.Index(PINECONE_INDEX, pool_threads=UPSERT_PARALLEL)  # type: ignore[union-attr]
+            except Exception as e:
+                _RAG_DISABLED_REASON = f"index_init_failed:{e.__class__.__name__}"
+                pc = None  # disable
+        finally:
+            _connect_done = True
+
+def warmup() -> None:
+    """Resolve the embedding dimension and index handle ahead of the first search."""
+    _connect()
 
 # --------------------------------------------------------------------------------------
 # Loaders (.txt/.json) + chunking
@@ -189,6 +385,9 @@ def _norm_source(path: pathlib.Path, extra: str = "") -> str:
         rel = path
     return f"{rel.as_posix()}{('::' + extra) if extra else ''}"
 
+def _loads(raw: bytes) -> Any:
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
 def _flatten_json(obj: Any, prefix: str = "") -> Iterable[Tuple[str, str]]:
     """Yield (json_path, text_value) pairs from nested JSON."""
     if isinstance(obj, dict):
@@ -204,6 +403,45 @@ def _flatten_json(obj: Any, prefix: str = "") -> Iterable[Tuple[str, str]]:
         if text.strip():
             yield prefix, text
 
+def _is_json_array(path: pathlib.Path) -> bool:
+    with open(path, "rb") as f:
+        head = f.read(64).lstrip(b"\xef\xbb\xbf \t\r\n")
+    return head.startswith(b"[")
+
+def _iter_json_pairs(path: pathlib.Path) -> Iterable[Tuple[str, str]]:
+    """(json_path, text) pairs for one file; big top-level arrays are streamed with ijson."""
+    if ijson is not None and path.stat().st_size >= STREAM_JSON_BYTES and _is_json_array(path):
+        with open(path, "rb") as f:
+            for i, item in enumerate(ijson.items(f, "item", use_float=True)):
+                yield from _flatten_json(item, f"[{i}]")
+        return
+    raw = path.read_bytes()
+    try:
+        obj = _loads(raw)
+    except ValueError:
+        # tolerate stray non-UTF-8 bytes like the old read_text(errors="ignore")
+        obj = json.loads(raw.decode("utf-8", errors="ignore"))
+    yield from _flatten_json(obj)
+
+def _load_json_docs(path: pathlib.Path) -> List[Dict[str, Any]]:
+    """Raw doc items for one JSON file ([] if it fails to parse)."""
+    base = _norm_source(path)  # relative_to() once per file, not once per leaf
+    items: List[Dict[str, Any]] = []
+    append = items.append
+    try:
+        for jpath, text in _iter_json_pairs(path):
+            src = f"{base}::{jpath}" if jpath else base
+            append({
+                "doc_id": _hash(src),
+                "text": text,
+                "source_stamp": src,
+                "meta": {"path": base, "kind": "json", "json_path": jpath}
+            })
+    except Exception as e:
+        print(f"⚠️ Failed to parse JSON: {path}: {e}")
+        return []
+    return items
+
 def load_corpus(data_dir: pathlib.Path = DATA_DIR) -> List[Dict[str, Any]]:
     """
     Returns list of raw docs:
@@ -231,22 +469,11 @@ def load_corpus(data_dir: pathlib.Path = DATA_DIR) -> List[Dict[str, Any]]:
                 "meta": {"path": src, "kind": "txt", "json_path": None}
             })
 
-    # .json
-    for path in data_dir.rglob("*.json"):
-        try:
-            obj = json.loads(path.read_text(encoding="utf-8", errors="ignore"))
-        except Exception as e:
-            print(f"⚠️ Failed to parse JSON: {path}: {e}")
-            continue
-        base = _norm_source(path)
-        for jpath, text in _flatten_json(obj):
-            src = _norm_source(path, jpath)
-            docs.append({
-                "doc_id": _hash(src),
-                "text": text,
-                "source_stamp": src,
-                "meta": {"path": base, "kind": "json", "json_path": jpath}
-            })
+    # .json (read + parse + flatten per file on a thread pool; map keeps file order)
+    json_paths = sorted(data_dir.rglob("*.json"))
+    with ThreadPoolExecutor(max_workers=max(1, LOAD_WORKERS)) as pool:
+        for items in pool.map(_load_json_docs, json_paths):
+            docs.extend(items)
 
     print(f"Loaded {len(docs)} raw doc items "
           f"({sum(1 for d in docs if d['meta']['kind']=='txt')} txt, "
@@ -260,21 +487,22 @@ def chunk_documents(raw_docs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
     chunks: List[Dict[str, Any]] = []
     for rd in raw_docs:
-        parts = splitter.split_text(rd["text"])
+        text = rd["text"]
+        # Most JSON slices are short scalars: one stripped chunk, no splitter pass needed
+        parts = [text.strip()] if len(text) <= DEFAULT_CHUNK_SIZE else splitter.split_text(text)
         for idx, part in enumerate(parts):
             if not part.strip():
                 continue
             cid_seed = f"{rd['doc_id']}::{idx}"
             cid = _hash(cid_seed)
+            # Per-chunk fields only; run-wide settings (chunk size/overlap, embed model)
+            # are reported once in the build_index summary instead of on every vector.
             meta = {
                 "source_stamp": rd["source_stamp"],
                 "path": rd["meta"]["path"],
                 "kind": rd["meta"]["kind"],
                 "json_path": rd["meta"]["json_path"],
                 "chunk_index": idx,
-                "chunk_size": DEFAULT_CHUNK_SIZE,
-                "chunk_overlap": DEFAULT_CHUNK_OVERLAP,
-                "embed_model": EMBED_MODEL,
             }
             chunks.append({
                 "id": cid,
@@ -303,16 +531,108 @@ def _pc_clean_meta(meta: Dict[str, Any]) -> Dict[str, Any]:
             clean[k] = str(v)
     return clean
 
-def _prepare_vectors(chunks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    texts = [c["text"] for c in chunks]
-    embs = embed_texts(texts)
-    vectors = []
-    for c, v in zip(chunks, embs):
-        meta = dict(c["metadata"])
-        meta.update({"text": c["text"], "source_stamp": c["source_stamp"]})
-        meta = _pc_clean_meta(meta)
-        vectors.append({"id": c["id"], "values": v, "metadata": meta})
-    return vectors
+def _l2_normalize(embs: List[List[float]]) -> List[List[float]]:
+    """Unit-normalize a batch in one float32 matrix op (cosine index: ranking unchanged)."""
+    if np is None or not embs:
+        return embs
+    mat = np.asarray(embs, dtype=np.float32)
+    norms = np.linalg.norm(mat, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    mat /= norms
+    if EMBED_PRECISION == "fp16":
+        # fp16 keeps ~3 significant digits; rounding in float64 keeps the JSON reprs short
+        mat = np.round(mat.astype(np.float16).astype(np.float64), 4)
+    return mat.tolist()
+
+# --- Embedding sidecar cache (sqlite) ------------------------------------------
+_cache_db: Optional[sqlite3.Connection] = None
+
+def _embed_cache() -> Optional[sqlite3.Connection]:
+    global _cache_db
+    if _cache_db is None and EMBED_CACHE:
+        try:
+            path = pathlib.Path(EMBED_CACHE)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            _cache_db = sqlite3.connect(str(path))
+            _cache_db.execute("PRAGMA journal_mode=WAL")
+            _cache_db.execute("CREATE TABLE IF NOT EXISTS emb (h BLOB PRIMARY KEY, v BLOB)")
+        except sqlite3.Error as e:
+            print(f"[rag_search] embed cache disabled: {e}", file=sys.stderr)
+            return None
+    return _cache_db
+
+def _cache_key(text: str) -> bytes:
+    # dtype is part of the key so float32 and int8 rows never get decoded as each other
+    return hashlib.sha1(f"{EMBED_MODEL}\0{EMBED_CACHE_DTYPE}\0{text}".encode("utf-8")).digest()
+
+def quantize_int8(vec: List[float]) -> Tuple[float, "array[int]"]:
+    """Symmetric scalar quantization: vec ~= scale * q with q in [-127, 127]."""
+    max_abs = max((abs(x) for x in vec), default=0.0)
+    scale = (max_abs / 127.0) or 1.0
+    return scale, array("b", (int(round(x / scale)) for x in vec))
+
+def dequantize_int8(scale: float, q: "array[int]") -> List[float]:
+    return [scale * x for x in q]
+
+def _encode_cached(vec: List[float]) -> bytes:
+    if EMBED_CACHE_DTYPE == "int8":
+        scale, q = quantize_int8(vec)
+        return array("f", [scale]).tobytes() + q.tobytes()
+    return array("f", vec).tobytes()
+
+def _decode_cached(blob: bytes) -> List[float]:
+    if EMBED_CACHE_DTYPE == "int8":
+        return dequantize_int8(array("f", blob[:4])[0], array("b", blob[4:]))
+    return array("f", blob).tolist()
+
+def _cache_get(texts: List[str]) -> Dict[str, List[float]]:
+    db = _embed_cache()
+    if db is None or not texts:
+        return {}
+    by_key = {_cache_key(t): t for t in texts}
+    keys = list(by_key)
+    found: Dict[str, List[float]] = {}
+    for i in range(0, len(keys), 500):  # stay under SQLite's bound-parameter limit
+        part = keys[i:i + 500]
+        rows = db.execute(f"SELECT h, v FROM emb WHERE h IN ({','.join('?' * len(part))})", part)
+        for h, v in rows:
+            found[by_key[h]] = _decode_cached(v)
+    return found
+
+def _cache_put(texts: List[str], vectors: List[List[float]]) -> None:
+    db = _embed_cache()
+    if db is None or not texts:
+        return
+    with db:  # one transaction per batch
+        db.executemany("INSERT OR REPLACE INTO emb (h, v) VALUES (?, ?)",
+                       [(_cache_key(t), _encode_cached(v)) for t, v in zip(texts, vectors)])
+
+def _embed_cached(texts: List[str]) -> List[List[float]]:
+    """embed_texts() backed by the sidecar cache: only unseen texts hit the embedder."""
+    hits = _cache_get(texts)
+    misses = [t for t in texts if t not in hits]
+    if misses:
+        vecs = embed_texts(misses)
+        _cache_put(misses, vecs)
+        hits.update(zip(misses, vecs))
+    return [hits[t] for t in texts]
+
+def _prepare_vectors(chunks: List[Dict[str, Any]],
+                     seen: Optional[Dict[str, List[float]]] = None) -> List[Dict[str, Any]]:
+    """Build upsert payloads; texts already in `seen` (text -> vector) are not re-embedded."""
+    seen = {} if seen is None else seen
+    fresh = list(dict.fromkeys(c["text"] for c in chunks if c["text"] not in seen))
+    if fresh:
+        seen.update(zip(fresh, _l2_normalize(_embed_cached(fresh))))
+    embs = [seen[c["text"]] for c in chunks]
+    return [
+        {
+            "id": c["id"],
+            "values": v,
+            "metadata": _pc_clean_meta({**c["metadata"], "text": c["text"], "source_stamp": c["source_stamp"]}),
+        }
+        for c, v in zip(chunks, embs)
+    ]
 
 def _batched(it: Iterable[Any], n: int) -> Iterable[List[Any]]:
     batch: List[Any] = []
@@ -324,36 +644,67 @@ def _batched(it: Iterable[Any], n: int) -> Iterable[List[Any]]:
     if batch:
         yield batch
 
+def _upsert_with_retry(vectors: List[Dict[str, Any]], ns: str, max_retries: int) -> int:
+    attempt, backoff = 0, 1.0
+    while True:
+        try:
+            # cast index to Any to avoid strict type checks from pinecone stubs
+            cast(Any, index).upsert(vectors=vectors, namespace=ns)
+            return len(vectors)
+        except Exception as e:
+            attempt += 1
+            if attempt > max_retries:
+                print("❌ Upsert failed after retries.", e)
+                return 0
+            time.sleep(backoff)
+            backoff *= 2
+
+def _await_upsert(handle: Any, vectors: List[Dict[str, Any]], ns: str, max_retries: int) -> int:
+    """Wait for an async upsert; on failure fall back to the synchronous retry loop."""
+    try:
+        handle.get()
+        return len(vectors)
+    except Exception:
+        return _upsert_with_retry(vectors, ns, max_retries)
+
 def upsert_chunks(chunks: List[Dict[str, Any]],
                   namespace: Optional[str] = None,
                   batch_size: int = BATCH_SIZE,
                   max_retries: int = 5) -> int:
+    _connect()
     if pc is None or _RAG_DISABLED_REASON:
         print(f"[rag_search] upsert skipped (disabled: {_RAG_DISABLED_REASON})")
         return 0
     ns = namespace or PINECONE_NS
     total = 0
-    for batch in _batched(chunks, batch_size):
-        vectors = _prepare_vectors(batch)
-        attempt, backoff = 0, 1.0
-        while True:
+    _query_cache_clear()  # cached results may no longer be the best matches
+    # Smart batching: group chunks of similar length so each embed request pads to a
+    # similar max length. Chunk ids are content-derived, so upsert order is irrelevant.
+    by_length = sorted(chunks, key=lambda c: len(c["text"]))
+    in_flight: List[Tuple[Any, List[Dict[str, Any]]]] = []
+    # Repeated chunk texts (shared boilerplate across state files) are embedded once per run
+    seen: Dict[str, List[float]] = {}
+    # Embed in windows of EMBED_BATCH (large on a GPU server) and upsert in batch_size slices
+    for group in _batched(by_length, max(batch_size, EMBED_BATCH)):
+        prepared = _prepare_vectors(group, seen)
+        for vectors in _batched(prepared, batch_size):
             try:
-                # cast index to Any to avoid strict type checks from pinecone stubs
-                cast(Any, index).upsert(vectors=vectors, namespace=ns)
-                total += len(vectors)
-                break
-            except Exception as e:
-                attempt += 1
-                if attempt > max_retries:
-                    print("❌ Upsert failed after retries.", e)
-                    break
-                time.sleep(backoff)
-                backoff *= 2
+                handle = cast(Any, index).upsert(vectors=vectors, namespace=ns, async_req=True)
+            except Exception:
+                total += _upsert_with_retry(vectors, ns, max_retries)
+                continue
+            in_flight.append((handle, vectors))
+            if len(in_flight) >= UPSERT_PARALLEL:
+                h, v = in_flight.pop(0)
+                total += _await_upsert(h, v, ns, max_retries)
+    for h, v in in_flight:
+        total += _await_upsert(h, v, ns, max_retries)
     return total
 
 def build_index(data_dir: pathlib.Path = DATA_DIR,
                 namespace: Optional[str] = None,
                 batch_size: int = BATCH_SIZE) -> Dict[str, Any]:
+    _connect()
     if pc is None or _RAG_DISABLED_REASON:
         return {"error": f"rag_disabled:{_RAG_DISABLED_REASON}"}
     ns = namespace or PINECONE_NS
@@ -369,17 +720,21 @@ def build_index(data_dir: pathlib.Path = DATA_DIR,
         "chunks_upserted": count,
         "embed_model": EMBED_MODEL,
         "dim": EMBED_DIM,
+        "chunk_size": DEFAULT_CHUNK_SIZE,
+        "chunk_overlap": DEFAULT_CHUNK_OVERLAP,
     }
     print("✅ Build complete:", summary)
     return summary
 
 def wipe_namespace(namespace: Optional[str] = None) -> None:
+    _connect()
     ns = namespace or PINECONE_NS
     print(f"⚠️ Deleting all vectors in index='{PINECONE_INDEX}', namespace='{ns}' ...")
     if pc is None or _RAG_DISABLED_REASON:
         print(f"[rag_search] wipe skipped (disabled: {_RAG_DISABLED_REASON})")
         return
     cast(Any, index).delete(delete_all=True, namespace=ns)  # type: ignore[attr-defined]
+    _query_cache_clear()
     print("✅ Namespace wiped.")
 
 # --------------------------------------------------------------------------------------
@@ -404,16 +759,90 @@ def _extract_matches(res: Any) -> List[Dict[str, Any]]:
     # try attribute
     return getattr(res, "matches", []) or []
 
+# --- Query result cache -------------------------------------------------------
+# (query text, options) -> (expires_at, unit query vector or None, results)
+_QUERY_RESULT_CACHE: "OrderedDict[Tuple[str, Tuple[Any, ...]], Tuple[float, Any, List[Dict[str, Any]]]]" = OrderedDict()
+_query_cache_lock = threading.Lock()
+
+def _query_opts(*opts: Any) -> Tuple[Any, ...]:
+    """Hashable cache key part for search options (metadata filters are nested dicts)."""
+    return tuple(json.dumps(o, sort_keys=True, default=str) if isinstance(o, (dict, list)) else o
+                 for o in opts)
+
+def _unit(vec: List[float]) -> Any:
+    if np is None:
+        return None
+    v = np.asarray(vec, dtype=np.float32)
+    n = float(np.linalg.norm(v))
+    return v / n if n else None
+
+def _query_cache_get(text: str, opts: Tuple[Any, ...], q_vec: Optional[List[float]] = None
+                     ) -> Optional[List[Dict[str, Any]]]:
+    """Cached results for the exact text, or (given ``q_vec`` and QUERY_CACHE_SIM) for the
+    most similar cached query vector under the same options."""
+    if QUERY_CACHE_TTL_HOURS <= 0:
+        return None
+    now = time.time()
+    with _query_cache_lock:
+        for key in [k for k, (exp, _, _) in _QUERY_RESULT_CACHE.items() if exp <= now]:
+            del _QUERY_RESULT_CACHE[key]
+        key = (text, opts)
+        if q_vec is None:
+            entry = _QUERY_RESULT_CACHE.get(key)
+        else:
+            entry = None
+            u = _unit(q_vec) if QUERY_CACHE_SIM > 0 else None
+            if u is not None:
+                best = QUERY_CACHE_SIM
+                for k, e in _QUERY_RESULT_CACHE.items():
+                    if k[1] == opts and e[1] is not None:
+                        sim = float(e[1] @ u)
+                        if sim >= best:
+                            best, key, entry = sim, k, e
+        if entry is None:
+            return None
+        _QUERY_RESULT_CACHE.move_to_end(key)
+        return [dict(r) for r in entry[2]]
+
+def _query_cache_put(text: str, opts: Tuple[Any, ...], q_vec: List[float],
+                     results: List[Dict[str, Any]]) -> None:
+    if QUERY_CACHE_TTL_HOURS <= 0:
+        return
+    u = _unit(q_vec) if QUERY_CACHE_SIM > 0 else None
+    with _query_cache_lock:
+        _QUERY_RESULT_CACHE[(text, opts)] = (time.time() + QUERY_CACHE_TTL_HOURS * 3600, u,
+                                             [dict(r) for r in results])
+        _QUERY_RESULT_CACHE.move_to_end((text, opts))
+        while len(_QUERY_RESULT_CACHE) > max(0, QUERY_CACHE_SIZE):
+            _QUERY_RESULT_CACHE.popitem(last=False)
+
+def _query_cache_clear() -> None:
+    with _query_cache_lock:
+        _QUERY_RESULT_CACHE.clear()
+
+def _match_values(m: Any) -> List[float]:
+    """Stored vector of a match (query with include_values=True); [] when absent."""
+    vals = m.get("values") if isinstance(m, dict) else getattr(m, "values", None)
+    return list(vals) if vals else []
+
 def semantic_search(query: str,
                     top_k: int = DEFAULT_TOP_K,
                     namespace: Optional[str] = None,
                     metadata_filter: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
     if not query or not query.strip():
         return []
+    _connect()
     if pc is None or _RAG_DISABLED_REASON:
         return []
     ns = namespace or PINECONE_NS
-    q_vec = embed_texts([query])[0]
+    text, opts = _norm_query(query), _query_opts("plain", int(top_k), ns, metadata_filter or None)
+    cached = _query_cache_get(text, opts)
+    if cached is not None:
+        return cached
+    q_vec = embed_query(text)
+    cached = _query_cache_get(text, opts, q_vec)
+    if cached is not None:
+        return cached
     res = cast(Any, index).query(  # type: ignore[attr-defined]
         namespace=ns,
         vector=q_vec,
@@ -426,12 +855,17 @@ def semantic_search(query: str,
     # limit returned results to top 2 chunks for downstream consumers
     top_n = min(int(top_k), 2)
     matches = matches[:top_n]
-    return [_normalize_match(m) for m in matches]
+    out = [_normalize_match(m) for m in matches]
+    _query_cache_put(text, opts, q_vec, out)
+    return out
 
 # --- MMR reranker (uses numpy if available) ----------------------------------
 def _mmr_rerank(query_vec, cand_vecs, lambda_mult: float = 0.7, top_k: int = 5) -> List[int]:
     """MMR reranker using numpy when available. Falls back to simple similarity sort.
 
+    ``cand_vecs`` may be a float16/float32 matrix or nested lists; similarities are always
+    computed on a float32 copy, since numpy has no BLAS kernel for float16 matmul.
+
     Returns indices of selected candidate vectors.
     """
     if np is None:
@@ -451,26 +885,28 @@ def _mmr_rerank(query_vec, cand_vecs, lambda_mult: float = 0.7, top_k: int = 5)
     cnorms = np.linalg.norm(cvecs, axis=1)
     qnorm = 1e-9 if qnorm == 0 else qnorm
     cnorms = np.where(cnorms == 0, 1e-9, cnorms)
-    sim_to_query = (cvecs @ qvec) / (cnorms * qnorm)
+    cvecs /= cnorms[:, None]
+    sim_to_query = cvecs @ (qvec / qnorm)
+    # All candidate-candidate cosines in one gemm; each pick then only folds its column
+    # into the running max similarity to the selected set
+    pair_sim = cvecs @ cvecs.T
 
     selected: List[int] = []
-    remaining = set(range(n))
-    while len(selected) < top_k and remaining:
+    taken = np.zeros(n, dtype=bool)
+    max_sim_to_selected = np.full(n, -np.inf, dtype=np.float32)
+    while len(selected) < top_k:
         if not selected:
             i = int(np.argmax(sim_to_query))
-            selected.append(i); remaining.remove(i); continue
-
-        sel_vecs = cvecs[selected]
-        sims_matrix = (cvecs @ sel_vecs.T) / (cnorms[:, None] * np.linalg.norm(sel_vecs, axis=1)[None, :])
-        max_sim_to_selected = np.max(sims_matrix, axis=1)
-        mmr_scores = lambda_mult * sim_to_query - (1.0 - lambda_mult) * max_sim_to_selected
-        mmr_scores[selected] = -np.inf  # mask already selected
-        i = int(np.argmax(mmr_scores))
-        if i in remaining:
-            selected.append(i); remaining.remove(i)
         else:
-            i = max(list(remaining), key=lambda j: sim_to_query[j])
-            selected.append(i); remaining.remove(i)
+            mmr_scores = lambda_mult * sim_to_query - (1.0 - lambda_mult) * max_sim_to_selected
+            mmr_scores[taken] = -np.inf  # mask already selected
+            i = int(np.argmax(mmr_scores))
+            if taken[i]:  # every score is -inf/NaN: best remaining by query similarity
+                rest = np.flatnonzero(~taken)
+                i = int(rest[np.argmax(sim_to_query[rest])])
+        selected.append(i)
+        taken[i] = True
+        np.maximum(max_sim_to_selected, pair_sim[:, i], out=max_sim_to_selected)
     return selected
 
 def semantic_search_reranked(query: str,
@@ -488,14 +924,23 @@ def semantic_search_reranked(query: str,
     ns = namespace or PINECONE_NS
     fetch_k = fetch_k or max(top_k * 3, top_k)
 
-    q_vec = embed_texts([query])[0]
+    _connect()
     if pc is None or _RAG_DISABLED_REASON:
         return []
+    text = _norm_query(query)
+    opts = _query_opts("mmr", int(top_k), ns, metadata_filter or None, int(fetch_k), float(lambda_mult))
+    cached = _query_cache_get(text, opts)
+    if cached is not None:
+        return cached
+    q_vec = embed_query(text)
+    cached = _query_cache_get(text, opts, q_vec)
+    if cached is not None:
+        return cached
     res = cast(Any, index).query(  # type: ignore[attr-defined]
         namespace=ns,
         vector=q_vec,
         top_k=fetch_k,
-        include_values=False,
+        include_values=True,  # candidates' stored embeddings feed MMR: no re-embed round-trip
         include_metadata=True,
         filter=metadata_filter or None,
     )
@@ -509,14 +954,24 @@ def semantic_search_reranked(query: str,
         return []
 
     idxs, texts = zip(*cand_texts)
-    cand_vecs = np.array(embed_texts(list(texts)), dtype=np.float32)
+    values = [_match_values(matches[i]) for i in idxs]
+    missing = [j for j, v in enumerate(values) if not v]
+    if len(missing) == len(values):  # e.g. an index that does not return values
+        cand_vecs = encode_batch(list(texts))
+    else:
+        if missing:  # embed just the texts whose vector did not come back
+            for j, v in zip(missing, encode_batch([texts[j] for j in missing])):
+                values[j] = v
+        cand_vecs = np.asarray(values, dtype=np.float32)
     selected_local = _mmr_rerank(np.array(q_vec, dtype=np.float32), cand_vecs,
                                  lambda_mult=lambda_mult, top_k=min(top_k, len(idxs)))
     selected_global = [idxs[i] for i in selected_local]
     # limit to top 2 chunks for downstream consumers
     top_n = min(int(top_k), 2)
     selected_global = selected_global[:top_n]
-    return [_normalize_match(matches[i]) for i in selected_global]
+    out = [_normalize_match(matches[i]) for i in selected_global]
+    _query_cache_put(text, opts, q_vec, out)
+    return out
 
 def rag_search(args: Union[str, Dict[str, Any]]) -> Dict[str, Any]:
     """
@@ -9,6 +9,9 @@ Provides comprehensive region-specific agricultural information including:
 
 Data source: JSON files under data/static_json/crop_calendar/<state>_<district>.json
 Resolution: Exact matching with smart fallback to RAG/web search
+(when both are allowed they run concurrently; RAG wins if it has passages). With
+allow_web, every fallback issues a live web_search request, whose result is
+discarded when RAG has passages.
 
 Args:
 {
@@ -36,12 +39,23 @@ Return envelope (always):
 
 from __future__ import annotations
 
+import asyncio
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 import re
+from types import MappingProxyType
 from typing import Any, Dict, List, Optional, Tuple
 
+try:
+    import orjson
+except Exception:
+    orjson = None  # stdlib json fallback
+
+_loads = orjson.loads if orjson is not None else json.loads
+
 try:
     from .paths import CROP_CALENDAR_DIR  # type: ignore
 except Exception:
@@ -51,12 +65,29 @@ except Exception:
         CROP_CALENDAR_DIR = Path(__file__).resolve().parent / ".." / "data" / "static_json" / "crop_calendar"
         CROP_CALENDAR_DIR = CROP_CALENDAR_DIR.resolve()
 
+# Fallback search tools, resolved once at import (None when unavailable)
+try:
+    from .rag_search import rag_search as _rag_search  # type: ignore
+except Exception:
+    try:
+        from tools.rag_search import rag_search as _rag_search  # type: ignore
+    except Exception:
+        _rag_search = None
+try:
+    from .web_search import web_search as _web_search  # type: ignore
+except Exception:
+    try:
+        from tools.web_search import web_search as _web_search  # type: ignore
+    except Exception:
+        _web_search = None
+
 # path to new internal data location
 DATA_DIR = str(CROP_CALENDAR_DIR)
 
 _WS = re.compile(r"\s+")
 _NONALNUM = re.compile(r"[^a-z0-9_]+")
 
+@lru_cache(maxsize=4096)
 def _canon(s: str) -> str:
     """lowercase, collapse whitespace to single space, then turn spaces/hyphens into underscores."""
     x = _WS.sub(" ", s.strip().lower())
@@ -65,16 +96,48 @@ def _canon(s: str) -> str:
     x = _NONALNUM.sub("_", x)
     return x
 
-def _file_path(state: Optional[str], district: Optional[str]) -> Optional[str]:
-    if not state or not district:
-        return None
-    stem = f"{_canon(state)}_{_canon(district)}"
-    path = os.path.join(DATA_DIR, f"{stem}.json")
-    return path if os.path.exists(path) else None
+@lru_cache(maxsize=None)
+def _pack_path(fname: str) -> str:
+    """Absolute path of a pack file; memoized so request paths do no os.path string work."""
+    return os.path.join(DATA_DIR, fname)
 
+@lru_cache(maxsize=512)
 def _read_json(path: str) -> Dict[str, Any]:
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    """Parsed calendar file, cached per path (the static pack does not change at runtime).
+
+    Callers must treat the result as read-only; copy before annotating.
+    """
+    return _loads(Path(path).read_bytes())
+
+@lru_cache(maxsize=512)
+def _crop_index(path: str) -> Dict[str, Dict[str, Any]]:
+    """{crop_name.lower(): crop entry} for one calendar file (first entry wins)."""
+    index: Dict[str, Dict[str, Any]] = {}
+    for c in _read_json(path).get("crops", []) or []:
+        index.setdefault((c.get("crop_name") or "").strip().lower(), c)
+    return index
+
+def _preload() -> Tuple[List[str], Dict[str, List[str]]]:
+    """Parse every calendar file once at import.
+
+    Returns the file listing (os.listdir order) and {crop_name.lower(): [files...]}
+    so the per-call path does no directory scans or file reads.
+    """
+    try:
+        files = [f for f in os.listdir(DATA_DIR) if f.endswith(".json")]
+    except OSError:
+        return [], {}
+    crop_files: Dict[str, List[str]] = {}
+    for f in files:
+        try:
+            names = _crop_index(_pack_path(f))
+        except Exception:
+            continue  # unreadable file: surfaced per call as before
+        for name in names:
+            crop_files.setdefault(name, []).append(f)
+    return files, crop_files
+
+_CALENDAR_FILES, _CROP_FILES = _preload()
 
 def _normalize_crop_info(crop_data: Dict[str, Any]) -> Dict[str, Any]:
     """Normalize crop info to always include all expected fields with null values if missing."""
@@ -128,19 +191,17 @@ def _normalize_crop_info(crop_data: Dict[str, Any]) -> Dict[str, Any]:
         "sources": crop_data.get("sources", [])
     }
 
+_REGION_FIELDS = (
+    "state", "district", "agro_climatic_zone", "source_type", "source_url",
+    "doc_date", "last_checked", "normal_annual_rain_mm", "rainfall_pattern_notes",
+)
+
 def _normalize_region_info(doc: Dict[str, Any]) -> Dict[str, Any]:
     """Normalize region info to always include all expected fields with null values if missing."""
+    get = doc.get
     return {
-        "state": doc.get("state"),
-        "district": doc.get("district"),
-        "agro_climatic_zone": doc.get("agro_climatic_zone"),
-        "source_type": doc.get("source_type"),
-        "source_url": doc.get("source_url"),
-        "doc_date": doc.get("doc_date"),
-        "last_checked": doc.get("last_checked"),
-        "normal_annual_rain_mm": doc.get("normal_annual_rain_mm"),
-        "rainfall_pattern_notes": doc.get("rainfall_pattern_notes"),
-        "dominant_soils": doc.get("dominant_soils", []),
+        **{k: get(k) for k in _REGION_FIELDS},
+        "dominant_soils": get("dominant_soils", []),
         "crops": [_normalize_crop_info(crop) for crop in doc.get("crops", [])],
         "dataset_sources": [
             {
@@ -162,43 +223,19 @@ def _normalize_region_info(doc: Dict[str, Any]) -> Dict[str, Any]:
         ]
     }
 
-def _available_crops(doc: Dict[str, Any]) -> List[str]:
-    crops = []
-    for c in doc.get("crops", []) or []:
-        name = c.get("crop_name")
-        if name:
-            crops.append(str(name))
-    # unique + stable order
-    seen, out = set(), []
-    for n in crops:
-        k = n.lower()
-        if k not in seen:
-            seen.add(k)
-            out.append(n)
-    return out
-
-def _find_crop_info(doc: Dict[str, Any], crop: Optional[str]) -> Optional[Dict[str, Any]]:
-    if not crop:
-        return None
-    target = crop.strip().lower()
-    for c in doc.get("crops", []) or []:
-        if (c.get("crop_name") or "").strip().lower() == target:
-            return c
-    return None
+# Common misspellings in the data files (read-only; built once at import)
+_STATE_SPELLING = MappingProxyType({
+    "maharashtra": "maharastra",  # Files use maharastra (missing h)
+    # Add other common misspellings here as needed
+})
+
 
 def _normalize_state_spelling(state: str) -> str:
     """Handle common misspellings in state names to match file names."""
     if not state:
         return state
-    
-    # Common misspellings in the data files
-    spelling_map = {
-        "maharashtra": "maharastra",  # Files use maharastra (missing h)
-        # Add other common misspellings here as needed
-    }
-    
     canonical = _canon(state)
-    return spelling_map.get(canonical, canonical)
+    return _STATE_SPELLING.get(canonical, canonical)
 
 def _try_static_data(args: Dict[str, Any]) -> Dict[str, Any]:
     """Try to get data from static JSON files first."""
@@ -214,7 +251,7 @@ def _try_static_data(args: Dict[str, Any]) -> Dict[str, Any]:
 
     try:
         # List all JSON files in the crop calendar directory
-        matched_files = [f for f in os.listdir(DATA_DIR) if f.endswith(".json")]
+        matched_files = _CALENDAR_FILES or [f for f in os.listdir(DATA_DIR) if f.endswith(".json")]
 
         # If strict_region requested and both state+district present, require exact file
         if strict_region and state and district:
@@ -235,10 +272,9 @@ def _try_static_data(args: Dict[str, Any]) -> Dict[str, Any]:
         # If a specific file matched and no crop was requested, return full doc
         aggregated_matches: List[Dict[str, Any]] = []
 
-        # Helper: open and annotate doc
+        # Helper: open and annotate doc (shallow copy so the cached parse stays clean)
         def _load_doc(fname: str) -> Dict[str, Any]:
-            with open(os.path.join(DATA_DIR, fname), "r", encoding="utf-8") as fh:
-                d = json.load(fh)
+            d = dict(_read_json(_pack_path(fname)))
             d["_source_file"] = fname
             return d
 
@@ -252,12 +288,12 @@ def _try_static_data(args: Dict[str, Any]) -> Dict[str, Any]:
         # If crop is provided, search across all files for that crop
         if crop:
             target_crop = crop.strip().lower()
-            for f in matched_files:
-                doc = _load_doc(f)
-                for c in doc.get("crops", []) or []:
-                    if (c.get("crop_name") or "").strip().lower() == target_crop:
-                        aggregated_matches.append(doc)
-                        break
+            if _CALENDAR_FILES:
+                crop_hits = _CROP_FILES.get(target_crop, [])
+            else:
+                crop_hits = [f for f in matched_files if target_crop in _crop_index(_pack_path(f))]
+            for f in crop_hits:
+                aggregated_matches.append(_load_doc(f))
 
         # If only state provided (no district), collect all files for that state
         if state and not district:
@@ -287,13 +323,15 @@ def _try_static_data(args: Dict[str, Any]) -> Dict[str, Any]:
             if len(aggr_unique) == 1:
                 # Single file - return complete normalized structure
                 doc = aggr_unique[0]
-                normalized_doc = _normalize_region_info(doc)
-                
+
                 # If a specific crop was requested, filter to just that crop
+                # (before normalizing, so only the matching entries get rebuilt)
                 if crop:
-                    matching_crops = [c for c in normalized_doc["crops"] if (c.get("crop_name") or "").lower() == crop.lower()]
+                    target = crop.lower()
+                    matching_crops = [c for c in doc.get("crops", []) if (c.get("crop_name") or "").lower() == target]
                     if matching_crops:
-                        normalized_doc["crops"] = matching_crops
+                        doc = {**doc, "crops": matching_crops}
+                normalized_doc = _normalize_region_info(doc)
                 
                 return {
                     "data": normalized_doc,
@@ -316,7 +354,8 @@ def _try_static_data(args: Dict[str, Any]) -> Dict[str, Any]:
                 # Multiple files - merge into single comprehensive schema
                 # Use the first doc as base structure
                 base_doc = aggr_unique[0]
-                merged_doc = _normalize_region_info(base_doc)
+                # crops are rebuilt from every doc below, so don't normalize the base doc's
+                merged_doc = _normalize_region_info({**base_doc, "crops": []})
                 
                 # Collect all crops from all documents
                 all_crops = []
@@ -404,8 +443,9 @@ def _try_static_data(args: Dict[str, Any]) -> Dict[str, Any]:
 def _try_rag_fallback(query: str, k: int = 6) -> Dict[str, Any]:
     """Try RAG search as first fallback."""
     try:
-        from .rag_search import rag_search
-        payload = rag_search({"query": query, "k": k})
+        if _rag_search is None:
+            raise ImportError("rag_search unavailable")
+        payload = _rag_search({"query": query, "k": k})
         passages = (payload or {}).get("data", {}).get("passages", []) or []
         
         if passages:
@@ -436,8 +476,9 @@ def _try_rag_fallback(query: str, k: int = 6) -> Dict[str, Any]:
 def _try_web_fallback(query: str, k: int = 6) -> Dict[str, Any]:
     """Try web search as final fallback."""
     try:
-        from .web_search import web_search
-        payload = web_search({"query": query, "k": k})
+        if _web_search is None:
+            raise ImportError("web_search unavailable")
+        payload = _web_search({"query": query, "k": k})
         results = (payload or {}).get("data", {}).get("results", []) or []
         
         passages = [
@@ -473,8 +514,30 @@ def _try_web_fallback(query: str, k: int = 6) -> Dict[str, Any]:
             "_meta": {"suggest_experts": True}
         }
 
-def get_regional_crop_info(args: Dict[str, Any]) -> Dict[str, Any]:
-    """Get region-specific crop information including varieties, calendars, and practices."""
+async def _rag_fallback_async(query: str, k: int = 6) -> Dict[str, Any]:
+    return await asyncio.to_thread(_try_rag_fallback, query, k)
+
+
+async def _web_fallback_async(query: str, k: int = 6) -> Dict[str, Any]:
+    return await asyncio.to_thread(_try_web_fallback, query, k)
+
+
+async def _fallbacks(query: str, k: int, allow_rag: bool, allow_web: bool) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """(rag_result, web_result) for the allowed routes, fetched concurrently; None when not allowed.
+
+    The web request is always sent when allowed, even if RAG turns out to have passages.
+    """
+    async def _skip() -> None:
+        return None
+    rag, web = await asyncio.gather(
+        _rag_fallback_async(query, k) if allow_rag else _skip(),
+        _web_fallback_async(query, k) if allow_web else _skip(),
+    )
+    return rag, web
+
+
+async def get_regional_crop_info_async(args: Dict[str, Any]) -> Dict[str, Any]:
+    """Async variant of ``get_regional_crop_info``; RAG and web fallbacks run in parallel."""
     # Input validation and kind check
     if (args or {}).get("kind", "crop_calendar") != "crop_calendar":
         return {
@@ -493,22 +556,27 @@ def get_regional_crop_info(args: Dict[str, Any]) -> Dict[str, Any]:
         fb = args.get("fallback") or {}
         k = int(fb.get("k", 6))
         
-        # Try RAG first if allowed
+        # Try RAG first if allowed (web alongside it, when enabled)
         if fb.get("allow_rag", True):
-            rag_result = _try_rag_fallback(query, k)
+            rag_result, web_result = await _fallbacks(query, k, True, bool(fb.get("allow_web")))
             if rag_result.get("data"):
                 return {**rag_result, "_meta": {
                     **(rag_result.get("_meta") or {}),
                     "route": "rag_local",
                     "reason": "query_mode"
                 }}
+            if web_result and web_result.get("data"):
+                return {**web_result, "_meta": {
+                    **(web_result.get("_meta") or {}),
+                    "route": "web",
+                    "reason": "query_mode"
+                }}
             
-            # Add web suggestion if enabled
-            if fb.get("allow_web"):
+            if web_result is not None:
+                # web was already searched and came back empty: don't suggest repeating it
                 rag_result["_meta"] = {
-                    **(rag_result.get("_meta") or {}),
-                    "suggest_web_search": True,
-                    "search_query_suggestion": query
+                    key: val for key, val in (rag_result.get("_meta") or {}).items()
+                    if key not in ("suggest_web_search", "search_query_suggestion")
                 }
             return rag_result
 
@@ -517,7 +585,7 @@ def get_regional_crop_info(args: Dict[str, Any]) -> Dict[str, Any]:
     if static_result.get("data"):
         # If there's a query, append RAG results if allowed 
         if query and args.get("fallback", {}).get("allow_rag", True):
-            rag_result = _try_rag_fallback(query)
+            rag_result = await _rag_fallback_async(query)
             if rag_result.get("data"):
                 static_result["rag_data"] = rag_result.get("data")
                 static_result["_meta"] = {
@@ -542,16 +610,28 @@ def get_regional_crop_info(args: Dict[str, Any]) -> Dict[str, Any]:
     if state and district:
         fbq = f"crop information {state} {district} {fbq}"
 
-    # Try RAG fallback if allowed
-    if fb.get("allow_rag", True):
-        rag_result = _try_rag_fallback(fbq, k)
-        if rag_result.get("data"):
-            rag_result["_meta"] = {
-                **(rag_result.get("_meta") or {}),
-                "route": "rag_local",
+    # Try RAG (and web, if allowed) fallback; RAG is preferred when both return passages
+    rag_result, web_result = await _fallbacks(fbq, k, fb.get("allow_rag", True), bool(fb.get("allow_web")))
+    for result, route in ((rag_result, "rag_local"), (web_result, "web")):
+        if result and result.get("data"):
+            result["_meta"] = {
+                **(result.get("_meta") or {}),
+                "route": route,
                 "reason": "static_not_found"
             }
-            return rag_result
+            return result
 
     # Return final error state from static lookup
     return static_result
+
+
+def get_regional_crop_info(args: Dict[str, Any]) -> Dict[str, Any]:
+    """Get region-specific crop information including varieties, calendars, and practices."""
+    coro = get_regional_crop_info_async(args)
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    # Called from inside an event loop: drive the coroutine on a helper thread instead
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coro).result()